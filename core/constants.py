@@ -3,4 +3,7 @@
 
 LAYER_FEATURE_BATCH_SIZE = 100
 
-__all__ = ["LAYER_FEATURE_BATCH_SIZE"]
+# Parallel-runway suffix of the reciprocal end (09L/27R, 18C/36C).
+RECIPROCAL_RUNWAY_SUFFIX = {"L": "R", "R": "L", "C": "C", "": ""}
+
+__all__ = ["LAYER_FEATURE_BATCH_SIZE", "RECIPROCAL_RUNWAY_SUFFIX"]
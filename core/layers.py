@@ -4,14 +4,17 @@
 import os.path
 import re
 import traceback
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
 
+from qgis.PyQt.QtCore import QVariant  # type: ignore
 from qgis.PyQt.QtGui import QColor, QFont  # type: ignore
 from qgis.core import (  # type: ignore
     Qgis,
     QgsCategorizedSymbolRenderer,
     QgsFeature,
     QgsFeatureRequest,
+    QgsFeatureSink,
     QgsFillSymbol,
     QgsFields,
     QgsLayerTreeGroup,
@@ -37,6 +40,21 @@ from .run_log import QgsMessageLog
 
 PLUGIN_TAG = "SafeguardingBuilder"
 
+# Geometry type -> style_map key used when a layer has no explicit style key.
+DEFAULT_STYLE_KEY_BY_GEOMETRY = {
+    Qgis.GeometryType.Polygon: "Default Polygon",
+    Qgis.GeometryType.Line: "Default Line",
+    Qgis.GeometryType.Point: "Default Point",
+}
+
+# Field types the memory provider accepts as inline ``field=name:type`` URI
+# declarations; anything else goes through provider.addAttributes().
+_MEMORY_URI_FIELD_TYPES = {
+    QVariant.String: "string",
+    QVariant.Double: "double",
+    QVariant.Int: "integer",
+}
+
 
 class LayerMixin:
     def _setup_main_group(
@@ -44,6 +62,15 @@ class LayerMixin:
     ) -> Optional[QgsLayerTreeGroup]:
         """Finds and clears or creates the main layer group."""
         existing_group = root_node.findGroup(group_name)
+        if (
+            existing_group is not None
+            and existing_group.parent() is root_node
+            and not existing_group.children()
+        ):
+            # Nothing to tear down; reuse the empty top-level group in place.
+            # findGroup() also matches nested groups, which are rebuilt below.
+            self._stage_layer_tree_node(existing_group)
+            return existing_group
         if existing_group is not None:
             QgsMessageLog.logMessage(f"Removing existing group: {group_name}", PLUGIN_TAG, level=Qgis.Info)
             self._remove_group_recursively(existing_group, project)
@@ -74,18 +101,26 @@ class LayerMixin:
             )
 
     def _remove_group_recursively(self, group_node: QgsLayerTreeGroup, project: QgsProject):
-        """Helper to remove layers within a group and its subgroups."""
+        """Helper to remove layers within a group and its subgroups.
+
+        Layers are collected depth-first and removed from the project in one
+        removeMapLayers() call so QGIS emits a single removal notification.
+        """
         if group_node is None:
             return
-        children_copy = list(group_node.children())
-        for node in children_copy:
-            if isinstance(node, QgsLayerTreeLayer):
-                layer_id = node.layerId()
-                if layer_id and project.mapLayer(layer_id):
-                    project.removeMapLayer(layer_id)
-            elif isinstance(node, QgsLayerTreeGroup):
-                self._remove_group_recursively(node, project)
-                group_node.removeChildNode(node)
+        layer_ids = []
+        pending_groups = [group_node]
+        while pending_groups:
+            for node in pending_groups.pop().children():
+                if isinstance(node, QgsLayerTreeLayer):
+                    layer_id = node.layerId()
+                    if layer_id and project.mapLayer(layer_id):
+                        layer_ids.append(layer_id)
+                elif isinstance(node, QgsLayerTreeGroup):
+                    pending_groups.append(node)
+        if layer_ids:
+            project.removeMapLayers(layer_ids)
+        group_node.removeAllChildren()
 
     def _sanitize_filename(self, name: str, replace_char: str = "_") -> str:
         """Removes or replaces characters invalid for filenames."""
@@ -118,26 +153,32 @@ class LayerMixin:
 
         batch_size = max(1, int(batch_size))
         provider_fields = provider.fields()
+        # Field metadata is identical for every feature; read it once rather
+        # than crossing into C++ for each attribute of each feature.
+        field_lengths = [provider_fields.at(index).length() for index in range(provider_fields.count())]
+        field_count = len(field_lengths)
         for feature in features:
-            normalised_attrs = []
             attrs = feature.attributes()
-            for field_index in range(provider_fields.count()):
-                value = attrs[field_index] if field_index < len(attrs) else None
-                field = provider_fields.at(field_index)
-                if isinstance(value, str) and field.length() > 0:
-                    value = value[: field.length()]
-                normalised_attrs.append(value)
+            if len(attrs) < field_count:
+                attrs = list(attrs) + [None] * (field_count - len(attrs))
+            normalised_attrs = [
+                value[:max_length] if max_length > 0 and isinstance(value, str) else value
+                for value, max_length in zip(attrs, field_lengths)
+            ]
             feature.setFields(provider_fields)
             feature.setAttributes(normalised_attrs)
 
+        # Generated features never need their provider-assigned ids back, so
+        # the provider can skip copying ids onto the Python-side features.
+        add_flags = QgsFeatureSink.FastInsert
         while features:
             batch = features[:batch_size]
-            add_ok, _ = provider.addFeatures(batch)
+            add_ok, _ = provider.addFeatures(batch, add_flags)
             if not add_ok:
                 failed_features = 0
                 first_geometry_detail = None
                 for batch_index, feature in enumerate(batch):
-                    single_ok, _ = provider.addFeatures([feature])
+                    single_ok, _ = provider.addFeatures([feature], add_flags)
                     if single_ok:
                         continue
                     failed_features += 1
@@ -196,6 +237,33 @@ class LayerMixin:
             return geometry_type_str
         return f"Multi{geometry_type_str}"
 
+    @staticmethod
+    def _memory_layer_field_uri(fields: QgsFields) -> Optional[str]:
+        """Serialise fields as memory-provider URI declarations.
+
+        Returns None when any field type has no inline form, in which case the
+        caller adds the schema through the provider instead.
+        """
+        declarations = []
+        for field in fields:
+            type_name = _MEMORY_URI_FIELD_TYPES.get(field.type())
+            if type_name is None:
+                return None
+            declarations.append(
+                f"field={quote(field.name(), safe='')}:{type_name}({field.length()},{field.precision()})"
+            )
+        return "&".join(declarations)
+
+    @staticmethod
+    def _fields_match(actual: QgsFields, expected: QgsFields) -> bool:
+        """True when two schemas agree on name, type, length and precision."""
+        if actual.count() != expected.count():
+            return False
+        return all(
+            (a.name(), a.type(), a.length(), a.precision()) == (e.name(), e.type(), e.length(), e.precision())
+            for a, e in zip(actual, expected)
+        )
+
     def _create_and_add_layer(
         self,
         geometry_type_str: str,
@@ -215,7 +283,6 @@ class LayerMixin:
         plugin_tag = PLUGIN_TAG
         project = QgsProject.instance()
         target_crs = project.crs()
-        target_crs.authid()
 
         if not features:
             QgsMessageLog.logMessage(
@@ -231,7 +298,13 @@ class LayerMixin:
                 features,
             )
             uri = f"{geometry_type_str}?crs={target_crs.authid()}"
-            layer = QgsVectorLayer(uri, display_name, "memory")
+            fields_declared = False
+            field_uri = self._memory_layer_field_uri(fields)
+            if field_uri:
+                layer = QgsVectorLayer(f"{uri}&{field_uri}", display_name, "memory")
+                fields_declared = layer.isValid() and self._fields_match(layer.fields(), fields)
+            if not fields_declared:
+                layer = QgsVectorLayer(uri, display_name, "memory")
             if not layer.isValid():
                 QgsMessageLog.logMessage(
                     f"Failed to create layer '{display_name}' with URI '{uri}'",
@@ -249,14 +322,15 @@ class LayerMixin:
                 )
                 return None
 
-            if not provider.addAttributes(fields):
-                QgsMessageLog.logMessage(
-                    f"Failed to add fields to layer '{display_name}'",
-                    plugin_tag,
-                    Qgis.Critical,
-                )
-                return None
-            layer.updateFields()
+            if not fields_declared:
+                if not provider.addAttributes(fields):
+                    QgsMessageLog.logMessage(
+                        f"Failed to add fields to layer '{display_name}'",
+                        plugin_tag,
+                        Qgis.Critical,
+                    )
+                    return None
+                layer.updateFields()
             if not self._add_features_in_batches(provider, features, display_name):
                 return None
             layer.updateExtents()
@@ -265,13 +339,7 @@ class LayerMixin:
                 layer.setCustomProperty("safeguarding_style_key", style_key)
 
             if self.output_mode == "file":
-                if not all(
-                    [
-                        self.output_path,
-                        self.output_format_driver,
-                        self.output_format_extension,
-                    ]
-                ):
+                if not (self.output_path and self.output_format_driver and self.output_format_extension):
                     QgsMessageLog.logMessage(
                         f"Skipping file save for '{display_name}': Output path/driver/extension missing.",
                         plugin_tag,
@@ -335,7 +403,7 @@ class LayerMixin:
                         Qgis.Warning,
                     )
 
-            QgsProject.instance().addMapLayer(layer, False)
+            project.addMapLayer(layer, False)
             layer_node = layer_group.addLayer(layer)
             self._stage_layer_tree_node(layer_node)
             self._apply_style(layer, self.style_map)
@@ -351,6 +419,17 @@ class LayerMixin:
             )
             return None
 
+    def _resolve_style_path(self, qml_filename: str) -> Tuple[str, bool]:
+        """Returns (absolute QML path, exists) for a style file, resolved once per run."""
+        cache = getattr(self, "_resolved_style_paths", None)
+        if cache is None:
+            cache = self._resolved_style_paths = {}
+        resolved = cache.get(qml_filename)
+        if resolved is None:
+            qml_path = os.path.join(self.plugin_dir, "styles", qml_filename)
+            resolved = cache[qml_filename] = (qml_path, os.path.exists(qml_path))
+        return resolved
+
     def _apply_style(self, layer: QgsVectorLayer, style_map: Dict[str, str]):
         """
         Applies QML style based on custom property.
@@ -369,19 +448,13 @@ class LayerMixin:
             if style_key:
                 qml_filename = style_map.get(str(style_key))
             if not qml_filename:
-                geom_type = layer.geometryType()
-                default_key_map = {
-                    Qgis.GeometryType.Polygon: "Default Polygon",
-                    Qgis.GeometryType.Line: "Default Line",
-                    Qgis.GeometryType.Point: "Default Point",
-                }
-                default_key = default_key_map.get(geom_type)
+                default_key = DEFAULT_STYLE_KEY_BY_GEOMETRY.get(layer.geometryType())
                 if default_key:
                     qml_filename = style_map.get(default_key)
 
             if qml_filename:
-                qml_path = os.path.join(self.plugin_dir, "styles", qml_filename)
-                if not os.path.exists(qml_path):
+                qml_path, qml_exists = self._resolve_style_path(qml_filename)
+                if not qml_exists:
                     QgsMessageLog.logMessage(
                         f"Style file not found: '{qml_path}' for layer '{layer_name}'",
                         plugin_tag,
@@ -24,6 +24,7 @@ from qgis.core import Qgis, QgsMessageLog as _QgsMessageLog  # type: ignore
 PLUGIN_TAG = "SafeguardingBuilder"
 DIAGNOSTIC_TAG = "SafeguardingBuilder.Diagnostics"
 DIAGNOSTICS_ENV_VAR = "SAFEGUARDING_BUILDER_DIAGNOSTICS"
+WARNING_SAMPLE_LIMIT = 25
 
 
 class EventKind(str, Enum):
@@ -104,6 +105,12 @@ def _one_line(value: Any) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
+def _warning_template(text: Optional[str]) -> str:
+    """Reduce a warning text to its kind by masking quoted names and numbers."""
+    template = re.sub(r"'[^']*'|\"[^\"]*\"", "<name>", text or "")
+    return re.sub(r"\d+(?:\.\d+)?", "<n>", template)
+
+
 def _ordered_facts(facts: Mapping[str, Any]):
     yielded = set()
     for key in _FACT_ORDER:
@@ -175,8 +182,10 @@ class RunLog:
         sink: Optional[Callable[[str, str, Any], None]] = None,
         *,
         diagnostics_enabled: Optional[bool] = None,
+        warning_sample_limit: int = WARNING_SAMPLE_LIMIT,
     ) -> None:
         self._sink = sink or _qgis_sink
+        self.warning_sample_limit = max(1, int(warning_sample_limit))
         self.diagnostics_enabled = (
             diagnostics_enabled_from_environment()
             if diagnostics_enabled is None
@@ -189,6 +198,8 @@ class RunLog:
         self.context: Dict[str, Any] = {}
         self.events = []
         self._pending: "OrderedDict[Tuple[Any, ...], Tuple[LogEvent, int]]" = OrderedDict()
+        self._distinct_warnings: Dict[Tuple[Any, ...], int] = {}
+        self._suppressed_warnings: "OrderedDict[Tuple[Any, ...], int]" = OrderedDict()
         self.skip_count = 0
         self.warning_count = 0
         self.error_count = 0
@@ -238,9 +249,33 @@ class RunLog:
             tuple(sorted((str(k), _one_line(v)) for k, v in event.facts.items())),
         )
         existing = self._pending.get(key)
+        if existing is None and event.kind == EventKind.WARN:
+            # Per-feature failures produce distinct texts that the identity
+            # aggregation above cannot merge; sample them per message template
+            # so one noisy kind cannot hide warnings of another kind.
+            sample_key = (
+                self.current_phase,
+                event.scope,
+                _warning_template(event.consequence),
+            )
+            distinct = self._distinct_warnings.get(sample_key, 0)
+            if distinct >= self.warning_sample_limit:
+                self._suppressed_warnings[sample_key] = self._suppressed_warnings.get(sample_key, 0) + 1
+                return
+            self._distinct_warnings[sample_key] = distinct + 1
         self._pending[key] = (event, 1 if existing is None else existing[1] + 1)
 
     def flush(self) -> None:
+        for (phase, scope, template), suppressed in self._suppressed_warnings.items():
+            summary = LogEvent(
+                EventKind.WARN,
+                scope=scope,
+                consequence="further distinct warnings were suppressed",
+                facts={"suppressed": suppressed},
+            )
+            self._pending[(phase, "suppressed", scope, template)] = (summary, 1)
+        self._suppressed_warnings.clear()
+        self._distinct_warnings.clear()
         for event, count in self._pending.values():
             if count > 1:
                 facts = dict(event.facts)
@@ -603,4 +638,5 @@ __all__ = [
     "emit_legacy",
     "render_event",
     "set_active_run_log",
+    "WARNING_SAMPLE_LIMIT",
 ]
@@ -71,7 +71,7 @@ class CnsTableMixin:
             self.findChild(QtWidgets.QPushButton, "pushButton_remove_CNS"),
         )
 
-        if not all([cns_table, add_button, remove_button]):
+        if not (cns_table and add_button and remove_button):
             QgsMessageLog.logMessage(
                 "Critical: CNS Manual Entry setup failed - widgets missing.",
                 DIALOG_LOG_TAG,
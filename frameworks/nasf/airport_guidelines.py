@@ -17,7 +17,7 @@ from qgis.core import (  # type: ignore
     QgsPointXY,
 )
 
-from .processor_base import NasfGuidelineProcessorBase
+from .processor_base import WMZ_FIELD_SPECS, NasfGuidelineProcessorBase
 
 try:
     from ...core.run_log import QgsMessageLog
@@ -74,16 +74,7 @@ class NasfAirportGuidelinesMixin(NasfGuidelineProcessorBase):
                     return False
                 display_name = f"{self.tr('WMZ')} {zone} ({r_in:.0f}-{r_out:.0f}km)"
                 internal_name = f"WMZ_{zone}_{icao_code}"
-                fields = QgsFields(
-                    [
-                        QgsField("zone", QVariant.String),
-                        QgsField("desc", QVariant.String),
-                        QgsField("inner_rad_km", QVariant.Double),
-                        QgsField("outer_rad_km", QVariant.Double),
-                        QgsField("ref_mos", QVariant.String),
-                        QgsField("ref_nasf", QVariant.String),
-                    ]
-                )
+                fields = self._fields_for(WMZ_FIELD_SPECS)
                 feature = QgsFeature(fields)
                 feature.setGeometry(geom)
                 feature.setAttributes(
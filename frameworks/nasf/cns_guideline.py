@@ -1,20 +1,18 @@
 # -*- coding: utf-8 -*-
 """CNS building restricted area generator backed by NASF policy parameters."""
 
+import re
 from typing import Any, List, Optional
 
-from qgis.PyQt.QtCore import QVariant  # type: ignore
 from qgis.core import (  # type: ignore
     Qgis,
     QgsCoordinateReferenceSystem,
     QgsFeature,
-    QgsField,
-    QgsFields,
     QgsGeometry,
     QgsLayerTreeGroup,
 )
 
-from .processor_base import NasfGuidelineProcessorBase
+from .processor_base import CNS_FIELD_SPECS, NasfGuidelineProcessorBase
 
 try:
     from ...core.run_log import QgsMessageLog
@@ -23,6 +21,33 @@ except ImportError:
 
 PLUGIN_TAG = "SafeguardingBuilder"
 
+# Any character outside str.isalnum() (underscore already maps to itself).
+_NON_ALNUM_RE = re.compile(r"\W")
+
+_CNS_RULES_NEEDING_ELEVATION = frozenset({"FacilityElevation + AGL", "Slope"})
+
+
+def _slope_height(elevation: Optional[float], _value: Any) -> Optional[float]:
+    """Placeholder for the unimplemented "Slope" rule; uses the facility elevation."""
+    QgsMessageLog.logMessage(
+        "Warning: Slope height rule 'Slope' not implemented.",
+        PLUGIN_TAG,
+        level=Qgis.Warning,
+    )
+    return elevation
+
+
+# Height rule -> (facility_elevation, height_value) -> required height.
+_CNS_HEIGHT_RULES = {
+    None: lambda elevation, _value: elevation,
+    "TBD": lambda elevation, _value: elevation,
+    "FacilityElevation + AGL": lambda elevation, value: (
+        elevation + float(value) if value is not None else elevation
+    ),
+    "Fixed_AMSL": lambda _elevation, value: float(value) if value is not None else None,
+    "Slope": _slope_height,
+}
+
 
 class NasfCnsGuidelineMixin(NasfGuidelineProcessorBase):
     def process_cns_building_restricted_areas(
@@ -41,19 +66,7 @@ class NasfCnsGuidelineMixin(NasfGuidelineProcessorBase):
             )
             return False
         overall_success = False
-        fields = QgsFields(
-            [
-                QgsField("sourcefacid", QVariant.String),
-                QgsField("factype", QVariant.String),
-                QgsField("surfname", QVariant.String),
-                QgsField("reqheight", QVariant.Double),
-                QgsField("guideline", QVariant.String),
-                QgsField("shape", QVariant.String),
-                QgsField("innerrad_m", QVariant.Double),
-                QgsField("outerrad_m", QVariant.Double),
-                QgsField("heightrule", QVariant.String),
-            ]
-        )
+        fields = self._fields_for(CNS_FIELD_SPECS)
 
         for facility_data in cns_facilities_data:
             facility_id = facility_data.get("id", "N/A")
@@ -89,7 +102,7 @@ class NasfCnsGuidelineMixin(NasfGuidelineProcessorBase):
                     )
                     fac_identifier = facility_id if facility_id != "N/A" else facility_type.replace(" ", "_")[:10]
                     internal_name_base = f"G_CNS_{icao_code}_{fac_identifier}_{surface_name.replace(' ', '_')}"
-                    internal_name_base = "".join(c if c.isalnum() else "_" for c in internal_name_base)
+                    internal_name_base = _NON_ALNUM_RE.sub("_", internal_name_base)
                     surface_geom = self._generate_circular_or_donut(
                         facility_geom,
                         surface_spec,
@@ -177,10 +190,8 @@ class NasfCnsGuidelineMixin(NasfGuidelineProcessorBase):
         if inner_radius is None or not isinstance(inner_radius, (int, float)) or inner_radius < 0:
             inner_radius = 0.0
         buffer_segments = 36
-        outer_geom = facility_point_geom.buffer(outer_radius, buffer_segments)
-        if not outer_geom or not outer_geom.isGeosValid():
-            outer_geom = outer_geom.makeValid() if outer_geom else None
-        if not outer_geom or not outer_geom.isGeosValid():
+        outer_geom = self._valid_or_repaired(facility_point_geom.buffer(outer_radius, buffer_segments))
+        if not outer_geom:
             QgsMessageLog.logMessage(
                 f"Error: Invalid outer buffer {outer_radius}m for '{description}'.",
                 PLUGIN_TAG,
@@ -194,10 +205,8 @@ class NasfCnsGuidelineMixin(NasfGuidelineProcessorBase):
                 return None
             if inner_radius <= 1e-6:
                 return outer_geom
-            inner_geom = facility_point_geom.buffer(inner_radius, buffer_segments)
-            if not inner_geom or not inner_geom.isGeosValid():
-                inner_geom = inner_geom.makeValid() if inner_geom else None
-            if not inner_geom or not inner_geom.isGeosValid():
+            inner_geom = self._valid_or_repaired(facility_point_geom.buffer(inner_radius, buffer_segments))
+            if not inner_geom:
                 QgsMessageLog.logMessage(
                     f"Error: Invalid inner buffer {inner_radius}m for DONUT '{description}'.",
                     PLUGIN_TAG,
@@ -205,14 +214,7 @@ class NasfCnsGuidelineMixin(NasfGuidelineProcessorBase):
                 )
                 return None
             try:
-                donut_geom = outer_geom.difference(inner_geom)
-                if donut_geom and donut_geom.isGeosValid():
-                    return donut_geom
-                elif donut_geom:
-                    fixed_donut = donut_geom.makeValid()
-                    return fixed_donut if fixed_donut and fixed_donut.isGeosValid() else None
-                else:
-                    return None
+                return self._valid_or_repaired(outer_geom.difference(inner_geom))
             except Exception as e:
                 QgsMessageLog.logMessage(
                     f"Error difference DONUT '{description}': {e}",
@@ -228,6 +230,20 @@ class NasfCnsGuidelineMixin(NasfGuidelineProcessorBase):
             )
             return None
 
+    @staticmethod
+    def _valid_or_repaired(geom: Optional[QgsGeometry]) -> Optional[QgsGeometry]:
+        """Returns geom when GEOS-valid, else its makeValid() repair, else None.
+
+        Valid input costs a single isGeosValid() call; only the repair path
+        pays for a second check.
+        """
+        if not geom:
+            return None
+        if geom.isGeosValid():
+            return geom
+        fixed = geom.makeValid()
+        return fixed if fixed and fixed.isGeosValid() else None
+
     def _calculate_cns_height(
         self,
         facility_elevation: Optional[float],
@@ -237,30 +253,19 @@ class NasfCnsGuidelineMixin(NasfGuidelineProcessorBase):
         facility_geom: QgsGeometry,
     ) -> Optional[float]:
         """Calculates the controlling height for the BRA surface. Placeholder."""
-        if facility_elevation is None and rule in ["FacilityElevation + AGL", "Slope"]:
+        if facility_elevation is None and rule in _CNS_RULES_NEEDING_ELEVATION:
             return None
         try:
-            if rule == "TBD" or rule is None:
-                return facility_elevation
-            elif rule == "FacilityElevation + AGL":
-                return facility_elevation + float(value) if value is not None else facility_elevation
-            elif rule == "Fixed_AMSL":
-                return float(value) if value is not None else None
-            elif rule == "Slope":
-                QgsMessageLog.logMessage(
-                    f"Warning: Slope height rule '{rule}' not implemented.",
-                    PLUGIN_TAG,
-                    level=Qgis.Warning,
-                )
-                return facility_elevation
-            else:
+            handler = _CNS_HEIGHT_RULES.get(rule)
+            if handler is None:
                 QgsMessageLog.logMessage(
                     f"Warning: Unknown height rule '{rule}'.",
                     PLUGIN_TAG,
                     level=Qgis.Warning,
                 )
                 return None
-        except (ValueError, TypeError, Exception) as e:
+            return handler(facility_elevation, value)
+        except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error calculating CNS height (Rule: {rule}, Val: {value}): {e}",
                 PLUGIN_TAG,
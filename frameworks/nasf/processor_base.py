@@ -1,8 +1,53 @@
 # -*- coding: utf-8 -*-
 """Shared helpers for NASF guideline processor mixins."""
 
+from typing import Dict, Tuple
+
+from qgis.PyQt.QtCore import QVariant  # type: ignore
+from qgis.core import QgsField, QgsFields  # type: ignore
+
 from ..registry import get_framework_profile
 
+FieldSpecs = Tuple[Tuple[str, int], ...]
+
+WSZ_FIELD_SPECS: FieldSpecs = (
+    ("rwy_name", QVariant.String),
+    ("desc", QVariant.String),
+    ("end_desig", QVariant.String),
+    ("ref_nasf", QVariant.String),
+)
+PSA_FIELD_SPECS: FieldSpecs = (
+    ("rwy", QVariant.String),
+    ("desc", QVariant.String),
+    ("end_desig", QVariant.String),
+    ("len_m", QVariant.Double),
+    ("inner_width", QVariant.Double),
+    ("outer_width", QVariant.Double),
+    ("ref_mos", QVariant.String),
+    ("ref_nasf", QVariant.String),
+)
+WMZ_FIELD_SPECS: FieldSpecs = (
+    ("zone", QVariant.String),
+    ("desc", QVariant.String),
+    ("inner_rad_km", QVariant.Double),
+    ("outer_rad_km", QVariant.Double),
+    ("ref_mos", QVariant.String),
+    ("ref_nasf", QVariant.String),
+)
+CNS_FIELD_SPECS: FieldSpecs = (
+    ("sourcefacid", QVariant.String),
+    ("factype", QVariant.String),
+    ("surfname", QVariant.String),
+    ("reqheight", QVariant.Double),
+    ("guideline", QVariant.String),
+    ("shape", QVariant.String),
+    ("innerrad_m", QVariant.Double),
+    ("outerrad_m", QVariant.Double),
+    ("heightrule", QVariant.String),
+)
+
+_FIELDS_CACHE: Dict[FieldSpecs, QgsFields] = {}
+
 
 class NasfGuidelineProcessorBase:
     def _active_safeguarding_framework(self):
@@ -10,3 +55,14 @@ class NasfGuidelineProcessorBase:
         if callable(getter):
             return getter()
         return get_framework_profile()
+
+    @staticmethod
+    def _fields_for(specs: FieldSpecs) -> QgsFields:
+        """Return a copy of the cached QgsFields built from ``specs``."""
+        fields = _FIELDS_CACHE.get(specs)
+        if fields is None:
+            fields = QgsFields([QgsField(name, field_type) for name, field_type in specs])
+            _FIELDS_CACHE[specs] = fields
+        # QgsFields is implicitly shared, so the copy is cheap and keeps the
+        # cached schema safe from callers that append fields.
+        return QgsFields(fields)
@@ -1,16 +1,13 @@
 # -*- coding: utf-8 -*-
 """Runway-based safeguarding generators backed by NASF policy parameters."""
 
-from qgis.PyQt.QtCore import QVariant  # type: ignore
 from qgis.core import (  # type: ignore
     Qgis,
     QgsFeature,
-    QgsField,
-    QgsFields,
     QgsLayerTreeGroup,
 )
 
-from .processor_base import NasfGuidelineProcessorBase
+from .processor_base import PSA_FIELD_SPECS, WSZ_FIELD_SPECS, NasfGuidelineProcessorBase
 
 try:
     from ...core.run_log import QgsMessageLog
@@ -34,14 +31,7 @@ class NasfRunwayGuidelinesMixin(NasfGuidelineProcessorBase):
         framework = self._active_safeguarding_framework()
         windshear = framework.windshear_parameters()
 
-        fields = QgsFields(
-            [
-                QgsField("rwy_name", QVariant.String),
-                QgsField("desc", QVariant.String),
-                QgsField("end_desig", QVariant.String),
-                QgsField("ref_nasf", QVariant.String),
-            ]
-        )
+        fields = self._fields_for(WSZ_FIELD_SPECS)
         features_to_add = []
         primary_desig, reciprocal_desig = runway_name.split("/") if "/" in runway_name else ("Primary", "Reciprocal")
         try:
@@ -126,78 +116,40 @@ class NasfRunwayGuidelinesMixin(NasfGuidelineProcessorBase):
         if psa_inner_half_w < 0 or psa_outer_half_w < 0:
             return False
 
-        fields = QgsFields(
-            [
-                QgsField("rwy", QVariant.String),
-                QgsField("desc", QVariant.String),
-                QgsField("end_desig", QVariant.String),
-                QgsField("len_m", QVariant.Double),
-                QgsField("inner_width", QVariant.Double),
-                QgsField("outer_width", QVariant.Double),
-                QgsField("ref_mos", QVariant.String),
-                QgsField("ref_nasf", QVariant.String),
-            ]
-        )
+        fields = self._fields_for(PSA_FIELD_SPECS)
         features_to_add = []
         primary_desig, reciprocal_desig = runway_name.split("/") if "/" in runway_name else ("Primary", "Reciprocal")
+        end_designators = (primary_desig, reciprocal_desig)
         try:
-            geom_p = self._create_trapezoid(
-                thr_point,
-                params["azimuth_r_p"],
+            psa_geoms = self._create_trapezoids(
+                (thr_point, rec_thr_point),
+                (params["direction_r_p"], params["direction_p_r"]),
                 psa_length,
                 psa_inner_half_w,
                 psa_outer_half_w,
-                f"PSA {primary_desig}",
+                tuple(f"PSA {desig}" for desig in end_designators),
             )
-            if geom_p:
-                feat = QgsFeature(fields)
-                feat.setGeometry(geom_p)
-                feat.setAttributes(
-                    [
-                        runway_name,
-                        f"Public Safety Area {primary_desig}",
-                        primary_desig,
-                        psa_length,
-                        psa_inner_width,
-                        psa_outer_width,
-                        psa["mos_ref"],
-                        psa["nasf_ref"],
-                    ]
-                )
-                features_to_add.append(feat)
         except Exception as e:
-            QgsMessageLog.logMessage(f"Error PSA Primary {runway_name}: {e}", PLUGIN_TAG, level=Qgis.Warning)
-        try:
-            geom_r = self._create_trapezoid(
-                rec_thr_point,
-                params["azimuth_p_r"],
-                psa_length,
-                psa_inner_half_w,
-                psa_outer_half_w,
-                f"PSA {reciprocal_desig}",
-            )
-            if geom_r:
-                feat = QgsFeature(fields)
-                feat.setGeometry(geom_r)
-                feat.setAttributes(
-                    [
-                        runway_name,
-                        f"Public Safety Area {reciprocal_desig}",
-                        reciprocal_desig,
-                        psa_length,
-                        psa_inner_width,
-                        psa_outer_width,
-                        psa["mos_ref"],
-                        psa["nasf_ref"],
-                    ]
-                )
-                features_to_add.append(feat)
-        except Exception as e:
-            QgsMessageLog.logMessage(
-                f"Error PSA Reciprocal {runway_name}: {e}",
-                PLUGIN_TAG,
-                level=Qgis.Warning,
+            QgsMessageLog.logMessage(f"Error PSA {runway_name}: {e}", PLUGIN_TAG, level=Qgis.Warning)
+            psa_geoms = []
+        for end_desig, geom in zip(end_designators, psa_geoms):
+            if not geom:
+                continue
+            feat = QgsFeature(fields)
+            feat.setGeometry(geom)
+            feat.setAttributes(
+                [
+                    runway_name,
+                    f"Public Safety Area {end_desig}",
+                    end_desig,
+                    psa_length,
+                    psa_inner_width,
+                    psa_outer_width,
+                    psa["mos_ref"],
+                    psa["nasf_ref"],
+                ]
             )
+            features_to_add.append(feat)
 
         layer_created = self._create_and_add_layer(
             "Polygon",
@@ -515,7 +515,7 @@ class OlsGuidelineMixin:
                 disp_thr_2 = float(disp_val_2) if disp_val_2 is not None else 0.0
 
                 # Check Essential Data
-                if not all([thr_point, rec_thr_point, arc_num_str]):
+                if not (thr_point and rec_thr_point and arc_num_str):
                     # Use Warning level for skips that prevent outline generation
                     QgsMessageLog.logMessage(
                         f"Skipping {rwy_name} strip outline - Missing essential data (Points/ARC Str).",
@@ -668,7 +668,7 @@ class OlsGuidelineMixin:
                     corner_r_l = strip_end_r.project(ihs_end_radius, rwy_params["azimuth_perp_l"])
                     corner_r_r = strip_end_r.project(ihs_end_radius, rwy_params["azimuth_perp_r"])
                     connector = None
-                    if all([corner_p_l, corner_p_r, corner_r_l, corner_r_r]):
+                    if corner_p_l and corner_p_r and corner_r_l and corner_r_r:
                         connector = self._create_polygon_from_corners(
                             [corner_p_l, corner_p_r, corner_r_r, corner_r_l],
                             f"Strip Connector {rwy_name}",
@@ -1606,13 +1606,14 @@ class OlsGuidelineMixin:
             return None
 
         # Get elevations along runway gradient
+        project_crs = QgsProject.instance().crs()
         z1_strip = self._get_elevation_at_point_along_gradient(
             strip_p1_xy,
             rwy_primary_thr_pt,
             rwy_reciprocal_thr_pt,
             rwy_primary_thr_elev,
             rwy_reciprocal_thr_elev,
-            QgsProject.instance().crs(),
+            project_crs,
         )
         z2_strip = self._get_elevation_at_point_along_gradient(
             strip_p2_xy,
@@ -1620,7 +1621,7 @@ class OlsGuidelineMixin:
             rwy_reciprocal_thr_pt,
             rwy_primary_thr_elev,
             rwy_reciprocal_thr_elev,
-            QgsProject.instance().crs(),
+            project_crs,
         )
 
         if z1_strip is None or z2_strip is None:
@@ -2573,7 +2574,7 @@ class OlsGuidelineMixin:
             arc_num_str = runway_data.get("arc_num")
             type1_str = runway_data.get("type1")
             type2_str = runway_data.get("type2")
-            if not all([runway_name, thr_point, rec_thr_point, arc_num_str]):
+            if not (runway_name and thr_point and rec_thr_point and arc_num_str):
                 continue
             try:
                 arc_num = int(arc_num_str)
@@ -2673,7 +2674,7 @@ class OlsGuidelineMixin:
                         p_start_r = current_section_start_pt.project(start_hw, az_perp_r)
                         p_end_l = end_pt.project(end_hw, az_perp_l)
                         p_end_r = end_pt.project(end_hw, az_perp_r)
-                        if all([p_start_l, p_end_l, p_start_r, p_end_r]):
+                        if p_start_l and p_end_l and p_start_r and p_end_r:
                             edge_l = QgsLineString([p_start_l, p_end_l])
                             edge_r = QgsLineString([p_start_r, p_end_r])
                             approach_edges_cache[(runway_name, end_desig, i, "L")] = edge_l
@@ -2933,7 +2934,7 @@ class OlsGuidelineMixin:
                     end_left = cl_end.project(strip_overall_half_width, rwy_params["azimuth_perp_l"])
                     end_right = cl_end.project(strip_overall_half_width, rwy_params["azimuth_perp_r"])
                     start_right = cl_start.project(strip_overall_half_width, rwy_params["azimuth_perp_r"])
-                    if not all([start_left, end_left, end_right, start_right]):
+                    if not (start_left and end_left and end_right and start_right):
                         continue
                     exclusion_geom = self._create_polygon_from_corners(
                         [start_left, end_left, end_right, start_right],
@@ -4140,17 +4141,18 @@ class OlsGuidelineMixin:
                     contour_elevs.add(round(end_elev, 6))
 
                 contour_elevs = sorted(contour_elevs)
+                max_delta_h = section_length * section_slope
+                inv_section_slope = 1.0 / section_slope if abs(section_slope) >= 1e-9 else 0.0
 
                 for target_elev in contour_elevs:
                     delta_h = target_elev - start_elev
-                    max_delta_h = section_length * section_slope
 
                     if abs(section_slope) < 1e-9:
                         dist_along = 0
                     else:
                         if delta_h < -1e-6 or delta_h > max_delta_h + 1e-6:
                             continue  # Skip contours outside this section
-                        dist_along = delta_h / section_slope
+                        dist_along = delta_h * inv_section_slope
 
                     if nominated_track is not None:
                         cl_point, _ = self._ols_track_point_azimuth(
@@ -4555,6 +4557,7 @@ class OlsGuidelineMixin:
                     contour_elevs.add(round(inner_horizontal_elevation_amsl, 6))
 
             contour_elevs = sorted(contour_elevs)
+            inv_slope = 1.0 / slope if slope != 0 else 0.0
 
             for target_elev in contour_elevs:
                 delta_h = target_elev - start_elev
@@ -4563,7 +4566,7 @@ class OlsGuidelineMixin:
                 else:
                     if delta_h < -1e-6 or delta_h > height_agl + 1e-6:
                         continue
-                    dist_along = delta_h / slope
+                    dist_along = delta_h * inv_slope
 
                 is_last_contour = abs(target_elev - end_elev) < 1e-6
 
@@ -2,6 +2,8 @@
 
 from typing import Any, Dict, Optional
 
+from ..ols_utils import is_valid_arc_number
+
 SOURCE_PUBLICATION = "UK CAA CAP 168 Licensing of Aerodromes, Edition 13"
 SOURCE_URL = "https://www.caa.co.uk/CAP168"
 
@@ -271,7 +273,7 @@ def get_strip_params(
         "variations": dict(STRIP_VARIATION_PARAMS),
     }
 
-    if not isinstance(arc_num, int) or arc_num not in [1, 2, 3, 4]:
+    if not is_valid_arc_number(arc_num):
         return results
 
     type_abbr = (type_abbr or "").upper()
@@ -2,6 +2,7 @@
 
 from typing import Any, Dict, Optional
 
+from ..ols_utils import VALID_ARC_NUMBERS, is_valid_arc_number
 from .classification import get_runway_type_abbr
 
 SOURCE_PUBLICATION = "UK CAA CAP 168 Licensing of Aerodromes, Edition 13"
@@ -199,7 +200,7 @@ def get_taxiway_traceability() -> Dict[str, Any]:
 
 
 def get_taxiway_separation_offset(arc_num: int, arc_let: Optional[str], runway_type_str: Optional[str]):
-    if not isinstance(arc_num, int) or arc_num not in [1, 2, 3, 4]:
+    if not is_valid_arc_number(arc_num):
         return None
     arc_let_str = _arc_letter(arc_let)
     if not arc_let_str:
@@ -234,7 +235,7 @@ def get_parallel_runway_separation(
 ):
     if not isinstance(arc_num_1, int) or not isinstance(arc_num_2, int):
         return None
-    if arc_num_1 not in [1, 2, 3, 4] or arc_num_2 not in [1, 2, 3, 4]:
+    if arc_num_1 not in VALID_ARC_NUMBERS or arc_num_2 not in VALID_ARC_NUMBERS:
         return None
 
     runway_1_is_ni = _runway_instrument_group(runway_type_1) == "NI"
@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from ..ols_utils import detached_params, is_valid_arc_number, lookup_detached, normalize_surface_type
-    from .classification import get_runway_type_abbr
+    from .classification import PRECISION_APPROACH_TYPES, get_runway_type_abbr
 except Exception:  # pragma: no cover - allows standalone inspection/testing
     from copy import deepcopy
 
@@ -46,6 +46,8 @@ except Exception:  # pragma: no cover - allows standalone inspection/testing
             return "NPA"
         return "NI"
 
+    PRECISION_APPROACH_TYPES = {"PA_I", "PA_II_III"}
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -769,38 +771,29 @@ def get_ols_params(
 
     if surface_type_upper in {"APPROACH", "APPROACHSURFACE"}:
         params = APPROACH_PARAMS.get(key_arc_type)
-        if not params and rwy_abbr.startswith("PA"):
+        if not params and rwy_abbr in PRECISION_APPROACH_TYPES:
             params = APPROACH_PARAMS.get((arc_num, "NPA")) or APPROACH_PARAMS.get((arc_num, "NI"))
         return detached_params(params) if params else None
 
     if surface_type_upper in {"INNERAPPROACH", "INNERAPPROACHSURFACE"}:
-        params_dict = INNER_APPROACH_PARAMS
-        lookup_key: Any = key_arc_type
-    elif surface_type_upper in {"BALKEDLANDING", "BALKEDLANDINGSURFACE", "BAULKEDLANDING", "BAULKEDLANDINGSURFACE"}:
-        params_dict = BALKED_LANDING_PARAMS
-        lookup_key = key_arc_type
-    elif surface_type_upper in {"TOCS", "TAKEOFFCLIMB", "TAKEOFFCLIMBSURFACE"}:
+        return lookup_detached(INNER_APPROACH_PARAMS, key_arc_type)
+    if surface_type_upper in {"BALKEDLANDING", "BALKEDLANDINGSURFACE", "BAULKEDLANDING", "BAULKEDLANDINGSURFACE"}:
+        return lookup_detached(BALKED_LANDING_PARAMS, key_arc_type)
+    if surface_type_upper in {"TOCS", "TAKEOFFCLIMB", "TAKEOFFCLIMBSURFACE"}:
         return get_tocs_params(arc_num)
-    elif surface_type_upper in {"IHS", "INNERHORIZONTAL", "INNERHORIZONTALSURFACE"}:
-        params_dict = IHS_PARAMS
-        lookup_key = key_arc_type
-    elif surface_type_upper in {"CONICAL", "CONICALSURFACE"}:
-        params_dict = CONICAL_PARAMS
-        lookup_key = key_arc_type
-    elif surface_type_upper in {"OHS", "OUTERHORIZONTAL", "OUTERHORIZONTALSURFACE"}:
-        params_dict = OHS_PARAMS
-        lookup_key = key_arc_type
-    elif surface_type_upper in {"TRANSITIONAL", "TRANSITIONALSURFACE"}:
-        params_dict = TRANSITIONAL_PARAMS
-        lookup_key = key_arc_type
-    elif surface_type_upper in {"INNERTRANSITIONAL", "INNERTRANSITIONALSURFACE"}:
-        params_dict = INNER_TRANSITIONAL_PARAMS
-        lookup_key = key_arc_type
-    else:
-        LOGGER.warning("Unknown OLS surface type %r requested.", surface_type)
-        return None
-
-    return lookup_detached(params_dict, lookup_key)
+    if surface_type_upper in {"IHS", "INNERHORIZONTAL", "INNERHORIZONTALSURFACE"}:
+        return lookup_detached(IHS_PARAMS, key_arc_type)
+    if surface_type_upper in {"CONICAL", "CONICALSURFACE"}:
+        return lookup_detached(CONICAL_PARAMS, key_arc_type)
+    if surface_type_upper in {"OHS", "OUTERHORIZONTAL", "OUTERHORIZONTALSURFACE"}:
+        return lookup_detached(OHS_PARAMS, key_arc_type)
+    if surface_type_upper in {"TRANSITIONAL", "TRANSITIONALSURFACE"}:
+        return lookup_detached(TRANSITIONAL_PARAMS, key_arc_type)
+    if surface_type_upper in {"INNERTRANSITIONAL", "INNERTRANSITIONALSURFACE"}:
+        return lookup_detached(INNER_TRANSITIONAL_PARAMS, key_arc_type)
+
+    LOGGER.warning("Unknown OLS surface type %r requested.", surface_type)
+    return None
 
 
 __all__ = [
@@ -2,6 +2,8 @@
 
 from typing import Any, Dict, Optional
 
+from ..ols_utils import is_valid_arc_number
+
 SOURCE_PUBLICATION = "EASA Easy Access Rules for Aerodromes, CS-ADR-DSN Issue 7"
 SOURCE_URL = (
     "https://www.easa.europa.eu/en/document-library/easy-access-rules/"
@@ -14,6 +16,8 @@ DECLARED_DISTANCE_EASA_REF = "CS ADR-DSN.B.035"
 CLEARWAY_EASA_REF = "CS ADR-DSN.B.195"
 STOPWAY_EASA_REF = "CS ADR-DSN.B.200"
 
+_INSTRUMENT_TYPE_ABBRS = frozenset({"NPA", "PA_I", "PA_II_III"})
+
 STRIP_WIDTH_PARAMS = {
     1: {
         "graded_widths": {
@@ -241,7 +245,7 @@ def get_strip_params(arc_num: int, type_abbr: str, runway_width: Optional[float]
         "easa_extension_length_ref": "N/A",
     }
 
-    if not isinstance(arc_num, int) or arc_num not in [1, 2, 3, 4]:
+    if not is_valid_arc_number(arc_num):
         return results
 
     type_abbr = (type_abbr or "").upper()
@@ -294,13 +298,13 @@ def get_resa_params(arc_num: int, type1_abbr: str, type2_abbr: str) -> dict:
         "easa_width_ref": RESA_PARAMS.get("width_ref", "N/A"),
     }
 
-    if not isinstance(arc_num, int) or arc_num not in [1, 2, 3, 4]:
+    if not is_valid_arc_number(arc_num):
         return results
 
     type1_abbr = (type1_abbr or "").upper()
     type2_abbr = (type2_abbr or "").upper()
-    is_instr_1 = type1_abbr in ["NPA", "PA_I", "PA_II_III"]
-    is_instr_2 = type2_abbr in ["NPA", "PA_I", "PA_II_III"]
+    is_instr_1 = type1_abbr in _INSTRUMENT_TYPE_ABBRS
+    is_instr_2 = type2_abbr in _INSTRUMENT_TYPE_ABBRS
 
     applicability_refs = RESA_PARAMS.get("applicability_refs", {})
     length_rules = RESA_PARAMS.get("length_rules", {})
@@ -21,7 +21,10 @@ def get_runway_type_abbr(runway_type_str: Optional[str]) -> str:
     if runway_type_str is None:
         return "NI"
 
-    abbr = RUNWAY_TYPE_MAP.get(runway_type_str.strip())
+    # Combo-box values arrive already canonical; only strip on a miss.
+    abbr = RUNWAY_TYPE_MAP.get(runway_type_str)
+    if abbr is None:
+        abbr = RUNWAY_TYPE_MAP.get(runway_type_str.strip())
     if abbr is None:
         LOGGER.warning(
             "Unknown runway type string %r could not be mapped, defaulting to NI.",
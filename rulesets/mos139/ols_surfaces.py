@@ -15,7 +15,7 @@ Runway Type Abbreviations Used:
 """
 
 import logging
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..ols_utils import detached_params, is_valid_arc_number, lookup_detached, normalize_surface_type
 from .classification import PRECISION_APPROACH_TYPES, RUNWAY_TYPE_MAP, get_runway_type_abbr
@@ -99,16 +99,6 @@ APPROACH_PARAMS: Dict[Tuple[int, str], List[Dict[str, Any]]] = {
             "ref": "MOS 7.08 Table 7.15(1) (1/2-NPA)",
         }
     ],
-    (2, "NPA"): [  # Same as Code 1
-        {
-            "length": 2500.0,
-            "slope": 0.0333,
-            "divergence": 0.15,
-            "start_dist_from_thr": 60.0,
-            "start_width": 140.0,
-            "ref": "MOS 7.08 Table 7.15(1) (1/2-NPA)",
-        }
-    ],
     (3, "NPA"): [
         # Section 1
         {
@@ -178,24 +168,6 @@ APPROACH_PARAMS: Dict[Tuple[int, str], List[Dict[str, Any]]] = {
             "ref": "MOS 7.08 Table 7.15(1) (1/2-PA-CatI S2)",
         },  # Check Total Length 15000 -> 3000+12000 = 15000. No horizontal section.
     ],
-    (2, "PA_I"): [  # Same as Code 1
-        # Section 1
-        {
-            "length": 3000.0,
-            "slope": 0.025,
-            "divergence": 0.15,
-            "start_dist_from_thr": 60.0,
-            "start_width": 140.0,
-            "ref": "MOS 7.08 Table 7.15(1) (1/2-PA-CatI S1)",
-        },
-        # Section 2
-        {
-            "length": 12000.0,
-            "slope": 0.03,
-            "divergence": 0.15,
-            "ref": "MOS 7.08 Table 7.15(1) (1/2-PA-CatI S2)",
-        },
-    ],
     (3, "PA_I"): [
         # Section 1
         {
@@ -221,31 +193,6 @@ APPROACH_PARAMS: Dict[Tuple[int, str], List[Dict[str, Any]]] = {
             "ref": "MOS 7.08 Table 7.15(1) (3/4-PA-CatI S3/Horiz)",
         },  # Check Total Length 15000 -> 3000+3600+8400 = 15000
     ],
-    (4, "PA_I"): [  # Same as Code 3
-        # Section 1
-        {
-            "length": 3000.0,
-            "slope": 0.02,
-            "divergence": 0.15,
-            "start_dist_from_thr": 60.0,
-            "start_width": 280.0,
-            "ref": "MOS 7.08 Table 7.15(1) (3/4-PA-CatI S1)",
-        },
-        # Section 2
-        {
-            "length": 3600.0,
-            "slope": 0.025,
-            "divergence": 0.15,
-            "ref": "MOS 7.08 Table 7.15(1) (3/4-PA-CatI S2)",
-        },
-        # Horizontal Section (Section 3)
-        {
-            "length": 8400.0,
-            "slope": 0.0,
-            "divergence": 0.15,
-            "ref": "MOS 7.08 Table 7.15(1) (3/4-PA-CatI S3/Horiz)",
-        },
-    ],
     # --- Precision Approach CAT II/III (PA_II_III) ---
     # Codes 1 & 2 not applicable
     (3, "PA_II_III"): [
@@ -273,33 +220,31 @@ APPROACH_PARAMS: Dict[Tuple[int, str], List[Dict[str, Any]]] = {
             "ref": "MOS 7.08 Table 7.15(1) (3/4-PA-CatII/III S3/Horiz)",
         },  # Check Total Length 15000 -> 3000+3600+8400 = 15000
     ],
-    (4, "PA_II_III"): [  # Same as Code 3
-        # Section 1
-        {
-            "length": 3000.0,
-            "slope": 0.02,
-            "divergence": 0.15,
-            "start_dist_from_thr": 60.0,
-            "start_width": 280.0,
-            "ref": "MOS 7.08 Table 7.15(1) (3/4-PA-CatII/III S1)",
-        },
-        # Section 2
-        {
-            "length": 3600.0,
-            "slope": 0.025,
-            "divergence": 0.15,
-            "ref": "MOS 7.08 Table 7.15(1) (3/4-PA-CatII/III S2)",
-        },
-        # Horizontal Section (Section 3)
-        {
-            "length": 8400.0,
-            "slope": 0.0,
-            "divergence": 0.15,
-            "ref": "MOS 7.08 Table 7.15(1) (3/4-PA-CatII/III S3/Horiz)",
-        },
-    ],
 }
 
+
+def _with_aliases(table: Dict[Any, Any], aliases: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Return ``table`` with each alias key sharing, and following, its canonical row."""
+    aliased: Dict[Any, Any] = {}
+    for key, params in table.items():
+        aliased[key] = params
+        if key in aliases:
+            aliased[aliases[key]] = params
+    return aliased
+
+
+# Table 7.15(1) repeats these columns verbatim for the paired code numbers.
+# Share the canonical rows; lookups always return detached copies.
+APPROACH_PARAMS = _with_aliases(
+    APPROACH_PARAMS,
+    {
+        (1, "NPA"): (2, "NPA"),
+        (1, "PA_I"): (2, "PA_I"),
+        (3, "PA_I"): (4, "PA_I"),
+        (3, "PA_II_III"): (4, "PA_II_III"),
+    },
+)
+
 # --- Inner Approach Surface ---
 # Applicable only for Precision Approach runways. Based on Table 7.15(1)
 INNER_APPROACH_PARAMS: Dict[Tuple[int, str], Dict[str, Any]] = {
@@ -311,13 +256,6 @@ INNER_APPROACH_PARAMS: Dict[Tuple[int, str], Dict[str, Any]] = {
         "slope": 0.025,  # 2.5%
         "ref": "MOS 7.10 (PA-CatI, 1/2)",
     },
-    (2, "PA_I"): {  # Same as Code 1
-        "width": 90.0,
-        "start_dist_from_thr": 60.0,
-        "length": 900.0,
-        "slope": 0.025,  # 2.5%
-        "ref": "MOS 7.10 (PA-CatI, 1/2)",
-    },
     (3, "PA_I"): {
         "width": 120.0,
         "start_dist_from_thr": 60.0,
@@ -327,15 +265,6 @@ INNER_APPROACH_PARAMS: Dict[Tuple[int, str], Dict[str, Any]] = {
         "code_letter_f_width_ref": "MOS 7.10 Table 7.15(1) note g",
         "ref": "MOS 7.10 (PA-CatI, 3/4)",
     },
-    (4, "PA_I"): {  # Same as Code 3
-        "width": 120.0,
-        "start_dist_from_thr": 60.0,
-        "length": 900.0,
-        "slope": 0.020,  # 2.0%
-        "code_letter_f_width": 140.0,
-        "code_letter_f_width_ref": "MOS 7.10 Table 7.15(1) note g",
-        "ref": "MOS 7.10 (PA-CatI, 3/4)",
-    },
     # Precision CAT II & III
     (3, "PA_II_III"): {
         "width": 120.0,
@@ -346,19 +275,19 @@ INNER_APPROACH_PARAMS: Dict[Tuple[int, str], Dict[str, Any]] = {
         "code_letter_f_width_ref": "MOS 7.10 Table 7.15(1) note g",
         "ref": "MOS 7.10 (PA-CatII/III, 3/4)",
     },
-    (4, "PA_II_III"): {  # Same as Code 3
-        "width": 120.0,
-        "start_dist_from_thr": 60.0,
-        "length": 900.0,
-        "slope": 0.020,  # 2.0%
-        "code_letter_f_width": 140.0,
-        "code_letter_f_width_ref": "MOS 7.10 Table 7.15(1) note g",
-        "ref": "MOS 7.10 (PA-CatII/III, 3/4)",
-    },
     # Non-Instrument ('NI') and Non-Precision ('NPA') types are not listed as the Inner Approach Surface does not apply
     # The get_ols_params function will return None if lookup fails.
 }
 
+INNER_APPROACH_PARAMS = _with_aliases(
+    INNER_APPROACH_PARAMS,
+    {
+        (1, "PA_I"): (2, "PA_I"),
+        (3, "PA_I"): (4, "PA_I"),
+        (3, "PA_II_III"): (4, "PA_II_III"),
+    },
+)
+
 # --- Inner Transitional Surface (only applies to instrument runways) ---
 INNER_TRANSITIONAL_PARAMS: Dict[Tuple[int, str], Dict[str, Any]] = {
     (1, "PA_I"): {"slope": 0.40, "ref": "MOS 7.11/Table 7.15 (1) (PA-CatI, 1/2)"},  # 40%
@@ -743,6 +672,55 @@ def get_inner_approach_params(
     return result
 
 
+# Approach rows to try, in order, per runway type.  PA runways without their
+# own row fall back to NPA, then NI; other types never fall back.
+_APPROACH_FALLBACK: Dict[str, Tuple[str, ...]] = {
+    "NI": ("NI",),
+    "NPA": ("NPA",),
+    **{abbr: (abbr, "NPA", "NI") for abbr in sorted(PRECISION_APPROACH_TYPES)},
+}
+
+
+def _approach_params(arc_num: int, runway_type_str: Optional[str], rwy_abbr: str):
+    """Approach lookup following the _APPROACH_FALLBACK order."""
+    for abbr in _APPROACH_FALLBACK.get(rwy_abbr, (rwy_abbr,)):
+        params = APPROACH_PARAMS.get((arc_num, abbr))
+        if params:
+            return detached_params(params)
+    return None
+
+
+def _table_lookup(params_dict: Dict[Any, Any], keyed_by_arc_only: bool = False):
+    """Build a dispatch handler that reads one parameter table."""
+    if keyed_by_arc_only:
+        return lambda arc_num, _runway_type_str, _rwy_abbr: lookup_detached(params_dict, arc_num)
+    return lambda arc_num, _runway_type_str, rwy_abbr: lookup_detached(params_dict, (arc_num, rwy_abbr))
+
+
+# Normalised surface label -> handler(arc_num, runway_type_str, rwy_abbr).
+_SURFACE_DISPATCH: Dict[str, Callable[[int, Optional[str], str], Any]] = {}
+for _labels, _handler in (
+    (("APPROACH", "APPROACHSURFACE"), _approach_params),
+    (
+        ("INNERAPPROACH", "INNERAPPROACHSURFACE"),
+        lambda arc_num, runway_type_str, _rwy_abbr: get_inner_approach_params(arc_num, runway_type_str),
+    ),
+    (
+        ("BALKEDLANDING", "BALKEDLANDINGSURFACE", "BAULKEDLANDING", "BAULKEDLANDINGSURFACE"),
+        lambda arc_num, runway_type_str, _rwy_abbr: get_baulked_landing_params(arc_num, runway_type_str),
+    ),
+    (("TOCS", "TAKEOFFCLIMB", "TAKEOFFCLIMBSURFACE"), _table_lookup(TOCS_PARAMS, keyed_by_arc_only=True)),
+    (("IHS", "INNERHORIZONTAL", "INNERHORIZONTALSURFACE"), _table_lookup(IHS_PARAMS)),
+    (("CONICAL", "CONICALSURFACE"), _table_lookup(CONICAL_PARAMS)),
+    (("OHS", "OUTERHORIZONTAL", "OUTERHORIZONTALSURFACE"), _table_lookup(OHS_PARAMS)),
+    (("TRANSITIONAL", "TRANSITIONALSURFACE"), _table_lookup(TRANSITIONAL_PARAMS)),
+    (("INNERTRANSITIONAL", "INNERTRANSITIONALSURFACE"), _table_lookup(INNER_TRANSITIONAL_PARAMS)),
+):
+    for _label in _labels:
+        _SURFACE_DISPATCH[_label] = _handler
+del _labels, _handler, _label
+
+
 def get_ols_params(arc_num: int, runway_type_str: Optional[str], surface_type: str):
     """
     Retrieves OLS parameters based on ARC number, runway type, and surface type.
@@ -754,72 +732,11 @@ def get_ols_params(arc_num: int, runway_type_str: Optional[str], surface_type: s
         return None
 
     rwy_abbr = get_runway_type_abbr(runway_type_str)
-    # Default key is (arc_num, rwy_abbr), used for most surfaces
-    # Some surfaces like TOCS might only use arc_num.
-    key_arc_type = (arc_num, rwy_abbr)
-    surface_type_upper = normalize_surface_type(surface_type)
-
-    params_dict: Optional[Dict] = None
-    lookup_key: Any = key_arc_type
-
-    if surface_type_upper in {"APPROACH", "APPROACHSURFACE"}:
-        params_dict = APPROACH_PARAMS
-        # Fallback logic specifically for Approach
-        params = params_dict.get(key_arc_type)
-        if not params and rwy_abbr.startswith("PA"):  # If PA type not found, try NPA then NI for same ARC
-            key_npa = (arc_num, "NPA")
-            params = params_dict.get(key_npa)
-            if not params:
-                key_ni = (arc_num, "NI")
-                params = params_dict.get(key_ni)
-        return detached_params(params) if params else None
-
-    elif surface_type_upper in {"INNERAPPROACH", "INNERAPPROACHSURFACE"}:
-        return get_inner_approach_params(arc_num, runway_type_str)
-
-    elif surface_type_upper in {"BALKEDLANDING", "BALKEDLANDINGSURFACE", "BAULKEDLANDING", "BAULKEDLANDINGSURFACE"}:
-        return get_baulked_landing_params(arc_num, runway_type_str)
-
-    elif surface_type_upper in {"TOCS", "TAKEOFFCLIMB", "TAKEOFFCLIMBSURFACE"}:
-        params_dict = TOCS_PARAMS
-        lookup_key = arc_num  # TOCS params keyed only by ARC number
-
-    elif surface_type_upper in {"IHS", "INNERHORIZONTAL", "INNERHORIZONTALSURFACE"}:
-        params_dict = IHS_PARAMS
-        # lookup_key remains key_arc_type
-
-    elif surface_type_upper in {"CONICAL", "CONICALSURFACE"}:
-        params_dict = CONICAL_PARAMS
-        # lookup_key remains key_arc_type
-
-    elif surface_type_upper in {"OHS", "OUTERHORIZONTAL", "OUTERHORIZONTALSURFACE"}:
-        params_dict = OHS_PARAMS
-        # lookup_key remains key_arc_type
-
-    elif surface_type_upper in {"TRANSITIONAL", "TRANSITIONALSURFACE"}:  # Main Transitional
-        params_dict = TRANSITIONAL_PARAMS
-        # lookup_key remains key_arc_type
-
-    elif surface_type_upper in {"INNERTRANSITIONAL", "INNERTRANSITIONALSURFACE"}:
-        params_dict = INNER_TRANSITIONAL_PARAMS  # If you have specific params for it
-        # lookup_key remains key_arc_type
-
-    else:
+    handler = _SURFACE_DISPATCH.get(normalize_surface_type(surface_type))
+    if handler is None:
         LOGGER.warning("Unknown OLS surface type %r requested.", surface_type)
         return None
-
-    # Common lookup for most types (except Approach which returned earlier)
-    if params_dict is not None:
-        return lookup_detached(params_dict, lookup_key)
-    else:
-        # This path should ideally not be reached if surface_type_upper matched a known type
-        # and params_dict was assigned. Could happen if a params_dict (e.g. BAULKED_LANDING_PARAMS)
-        # was not defined at the module level.
-        LOGGER.warning(
-            "Parameter dictionary is missing for known OLS surface type %r.",
-            surface_type_upper,
-        )
-        return None
+    return handler(arc_num, runway_type_str, rwy_abbr)
 
 
 # =========================================================================
@@ -1,10 +1,16 @@
 """MOS139 physical runway dimension policy."""
 
+from functools import lru_cache
 from typing import Optional
 
+from ..ols_utils import is_valid_arc_number
+
 PAVEMENT_MOS_REF = "MOS 4.01"
 SHOULDER_MOS_REF = "MOS 6.11"
 
+_NI_NPA_TYPE_ABBRS = frozenset({"NI", "NPA"})
+_INSTRUMENT_TYPE_ABBRS = frozenset({"NPA", "PA_I", "PA_II_III"})
+
 STRIP_WIDTH_PARAMS = {
     1: {
         "graded": 60.0,
@@ -60,6 +66,14 @@ def get_physical_refs():
 
 
 def get_strip_params(arc_num: int, type_abbr: str, runway_width: Optional[float]):
+    # The result only varies by code, type and the 45 m width split, so each
+    # combination is built once and callers receive their own copy.
+    narrow_runway = runway_width is not None and runway_width < 45.0
+    return dict(_strip_params(arc_num, type_abbr, narrow_runway))
+
+
+@lru_cache(maxsize=64, typed=True)
+def _strip_params(arc_num: int, type_abbr: str, narrow_runway: bool):
     results = {
         "overall_width": None,
         "graded_width": None,
@@ -71,7 +85,7 @@ def get_strip_params(arc_num: int, type_abbr: str, runway_width: Optional[float]
         "mos_graded_width_ref": "N/A",
         "mos_extension_length_ref": "N/A",
     }
-    if not isinstance(arc_num, int) or arc_num not in [1, 2, 3, 4]:
+    if not is_valid_arc_number(arc_num):
         return results
 
     width_rules = STRIP_WIDTH_PARAMS.get(arc_num, {})
@@ -83,7 +97,7 @@ def get_strip_params(arc_num: int, type_abbr: str, runway_width: Optional[float]
     if "graded" in width_rules:
         results["graded_width"] = width_rules["graded"]
     elif "graded_lt_45" in width_rules:
-        if runway_width is not None and runway_width < 45.0:
+        if narrow_runway:
             results["graded_width"] = width_rules["graded_lt_45"]
             results["mos_graded_width_ref"] += " (<45m)"
             results["graded_width_ref"] = results["mos_graded_width_ref"]
@@ -92,7 +106,7 @@ def get_strip_params(arc_num: int, type_abbr: str, runway_width: Optional[float]
             results["mos_graded_width_ref"] += " (>=45m)"
             results["graded_width_ref"] = results["mos_graded_width_ref"]
 
-    is_ni_or_npa = type_abbr in ["NI", "NPA"]
+    is_ni_or_npa = type_abbr in _NI_NPA_TYPE_ABBRS
     if arc_num in [1, 2] and is_ni_or_npa:
         results["overall_width"] = width_rules.get("overall_ni_npa")
         results["mos_overall_width_ref"] += " (Code 1/2 NI/NPA)"
@@ -118,6 +132,12 @@ def get_strip_params(arc_num: int, type_abbr: str, runway_width: Optional[float]
 
 
 def get_resa_params(arc_num: int, type1_abbr: str, type2_abbr: str):
+    is_instrument = type1_abbr in _INSTRUMENT_TYPE_ABBRS or type2_abbr in _INSTRUMENT_TYPE_ABBRS
+    return dict(_resa_params(arc_num, is_instrument))
+
+
+@lru_cache(maxsize=16, typed=True)
+def _resa_params(arc_num: int, is_instrument: bool):
     results = {
         "required": False,
         "length": None,
@@ -129,12 +149,6 @@ def get_resa_params(arc_num: int, type1_abbr: str, type2_abbr: str):
         "mos_width_ref": RESA_PARAMS.get("width_ref", "N/A"),
     }
 
-    is_instrument = type1_abbr in ["NPA", "PA_I", "PA_II_III"] or type2_abbr in [
-        "NPA",
-        "PA_I",
-        "PA_II_III",
-    ]
-
     applicability_refs = RESA_PARAMS.get("applicability_refs", {})
     length_rules = RESA_PARAMS.get("length_rules", {})
 
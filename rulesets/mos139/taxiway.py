@@ -3,6 +3,7 @@
 import logging
 from typing import Any, Dict, Optional, Tuple
 
+from ..ols_utils import VALID_ARC_NUMBERS, is_valid_arc_number
 from .classification import get_runway_type_abbr
 
 LOGGER = logging.getLogger(__name__)
@@ -127,7 +128,7 @@ STAND_TAXILANE_OBJECT_SEPARATION_PARAMS: Dict[str, Dict[str, Any]] = {}
 def get_taxiway_separation_offset(
     arc_num: int, arc_let: Optional[str], runway_type_str: Optional[str]
 ) -> Optional[Dict[str, Any]]:
-    if not isinstance(arc_num, int) or arc_num not in [1, 2, 3, 4]:
+    if not is_valid_arc_number(arc_num):
         LOGGER.warning("Invalid ARC Number %r for Taxiway Sep lookup.", arc_num)
         return None
 
@@ -158,7 +159,7 @@ def get_parallel_runway_separation(
     """Return MOS 6.05 minimum centre line separation for parallel runways."""
     if not isinstance(arc_num_1, int) or not isinstance(arc_num_2, int):
         return None
-    if arc_num_1 not in [1, 2, 3, 4] or arc_num_2 not in [1, 2, 3, 4]:
+    if arc_num_1 not in VALID_ARC_NUMBERS or arc_num_2 not in VALID_ARC_NUMBERS:
         LOGGER.warning(
             "Invalid ARC Numbers %r/%r for MOS139 parallel runway separation lookup.",
             arc_num_1,
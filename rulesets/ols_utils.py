@@ -1,6 +1,7 @@
 """Shared helpers for ruleset OLS parameter lookups."""
 
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Mapping, Optional
 
 
@@ -12,13 +13,34 @@ def is_valid_arc_number(arc_num: Any) -> bool:
     return isinstance(arc_num, int) and arc_num in VALID_ARC_NUMBERS
 
 
+@lru_cache(maxsize=256)
 def normalize_surface_type(surface_type: Optional[str]) -> str:
-    """Normalize free-text OLS surface labels for lookup dispatch."""
+    """Normalize free-text OLS surface labels for lookup dispatch.
+
+    Callers pass a handful of fixed labels many times per runway, so the
+    result is memoised; the returned string is immutable and safe to share.
+    """
     return "".join(char for char in str(surface_type or "").upper() if char.isalnum())
 
 
+_IMMUTABLE_LEAF_TYPES = (str, int, float, bool, type(None))
+
+
 def detached_params(params: Any) -> Any:
-    """Return a copy callers can mutate without changing ruleset constants."""
+    """Return a copy callers can mutate without changing ruleset constants.
+
+    Ruleset tables are nested dicts, lists and tuples of scalars, so those
+    containers are rebuilt directly and scalars are shared.  Anything else
+    falls back to ``deepcopy``.
+    """
+    if isinstance(params, _IMMUTABLE_LEAF_TYPES):
+        return params
+    if type(params) is dict:
+        return {key: detached_params(value) for key, value in params.items()}
+    if type(params) is list:
+        return [detached_params(value) for value in params]
+    if type(params) is tuple:
+        return tuple(detached_params(value) for value in params)
     return deepcopy(params)
 
 
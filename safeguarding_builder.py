@@ -8,10 +8,10 @@ import traceback
 from pathlib import Path
 
 # import functools # Not used directly
-from typing import Dict, Optional, List, Any, Tuple
+from typing import Dict, Optional, List, Any, Sequence, Tuple
 
 # --- Qt Imports ---
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, QVariant  # type: ignore
+from qgis.PyQt.QtCore import QFile, QSettings, QTranslator, QCoreApplication, QVariant  # type: ignore
 from qgis.PyQt.QtGui import QIcon  # type: ignore
 from qgis.PyQt.QtWidgets import QAction, QMessageBox, QPushButton  # type: ignore
 
@@ -24,6 +24,7 @@ from qgis.core import (  # type: ignore
     QgsFeature,
     QgsGeometry,
     QgsLineString,
+    QgsPoint,
     QgsPointXY,
     QgsPolygon,
     QgsLayerTreeGroup,
@@ -43,6 +44,7 @@ from .core.run_log import (
     RunLog,
     set_active_run_log,
 )
+from .core.constants import RECIPROCAL_RUNWAY_SUFFIX
 from .core.styles import DEFAULT_STYLE_MAP
 from .core.run_history import (
     RuntimeRunRecorder,
@@ -127,6 +129,8 @@ class SafeguardingBuilder(
         self.protected_airspace_policy: str = "ruleset_aligned"
         self._run_log: Optional[RunLog] = None
         self._generation_outcomes: List[GenerationOutcome] = []
+        self._runway_parameter_cache: Dict[Tuple[float, float, float, float], dict] = {}
+        self._resolved_style_paths: Dict[str, Tuple[str, bool]] = {}
         self.ruleset = get_ruleset_profile()
         self.baseline_ols_ruleset = self.ruleset
         self.comparison_ols_ruleset = None
@@ -432,10 +436,9 @@ class SafeguardingBuilder(
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
         icon_path = ":/plugins/safeguarding_builder/icon.png"
-        try:
-            if QIcon(icon_path).isNull():
-                raise NameError
-        except (NameError, TypeError):
+        # QFile.exists() resolves compiled resources without building a QIcon;
+        # add_action constructs the only icon.
+        if not QFile.exists(icon_path):
             icon_path_file = os.path.join(self.plugin_dir, "icon.png")
             if os.path.exists(icon_path_file):
                 icon_path = icon_path_file
@@ -457,7 +460,7 @@ class SafeguardingBuilder(
     def unload(self):
         """Removes the plugin menu item and icon from QGIS GUI."""
         for action in self.actions:
-            self.iface.removePluginMenu(self.tr("&Safeguarding Builder"), action)
+            self.iface.removePluginMenu(self.menu, action)
             self.iface.removeToolBarIcon(action)
         if self.dlg:
             try:
@@ -570,9 +573,6 @@ class SafeguardingBuilder(
             end_elev = rwy_data.get("runway_end_elev_1")
             rec_end_elev = rwy_data.get("runway_end_elev_2")
 
-            # Generate a name for logging/reporting
-            rwy_name = rwy_data.get("short_name", f"RWY Index {rwy_data.get('original_index', '?')}")
-
             # Check if the retrieved values are valid floats
             valid_end = isinstance(end_elev, (int, float))
             valid_rec = isinstance(rec_end_elev, (int, float))
@@ -585,6 +585,8 @@ class SafeguardingBuilder(
 
             # Collect summary if elevations are missing for this runway
             if not valid_end or not valid_rec:
+                # The runway name is only needed for the missing-elevation summary.
+                rwy_name = rwy_data.get("short_name", f"RWY Index {rwy_data.get('original_index', '?')}")
                 missing_parts = []
                 if not valid_end:
                     missing_parts.append("END1")
@@ -717,12 +719,14 @@ class SafeguardingBuilder(
             **dict(getattr(self.dlg, "_runtime_test_context", {}) or {}),
         )
         recorder.start_phase("startup")
+        frozen_canvas = self._freeze_map_canvas()
         try:
             return self._run_safeguarding_processing()
         except Exception:
             self._processing_run_status = "failed"
             raise
         finally:
+            self._thaw_map_canvas(frozen_canvas)
             layer_count, feature_count = self._runtime_generated_output_counts()
             try:
                 if not recorder._output_counts_set:
@@ -824,6 +828,8 @@ class SafeguardingBuilder(
         plugin_tag = PLUGIN_TAG
 
         self.successfully_generated_layers = []
+        self._runway_parameter_cache = {}
+        self._resolved_style_paths = {}
         self.reference_elevation_datum = None
         self.arp_elevation_amsl = None
         self.output_mode = "memory"
@@ -1239,10 +1245,15 @@ class SafeguardingBuilder(
             baseline_ols_requires_red = (
                 baseline_airport_spec.get("datum_name") == "reference_elevation_datum"
             )
-            pa_runways_exist = any(
-                "PA" in rwy.get("type1", "") or "PA" in rwy.get("type2", "") for rwy in runway_input_list if rwy
-            )
-            if self.reference_elevation_datum is None and pa_runways_exist and baseline_ols_requires_red:
+            if (
+                self.reference_elevation_datum is None
+                and baseline_ols_requires_red
+                and any(
+                    "PA" in rwy.get("type1", "") or "PA" in rwy.get("type2", "")
+                    for rwy in runway_input_list
+                    if rwy
+                )
+            ):
                 QgsMessageLog.logMessage(
                     "Aborting OLS generation: RED calculation failed and precision approach runways exist.",
                     plugin_tag,
@@ -1453,6 +1464,29 @@ class SafeguardingBuilder(
             else:
                 self._clear_processing_status()
 
+    def _freeze_map_canvas(self):
+        """Freeze the map canvas for a run; returns the canvas only if this call froze it.
+
+        Progress updates pump the event loop, so without this the canvas would
+        redraw as each generated layer and group lands in the layer tree.
+        """
+        canvas_getter = getattr(self.iface, "mapCanvas", None)
+        canvas = canvas_getter() if canvas_getter is not None else None
+        if canvas is None or canvas.isFrozen():
+            return None
+        canvas.freeze(True)
+        return canvas
+
+    def _thaw_map_canvas(self, canvas) -> None:
+        """Undo _freeze_map_canvas and redraw once with the generated layers."""
+        if canvas is None:
+            return
+        try:
+            canvas.freeze(False)
+            canvas.refresh()
+        except RuntimeError as exc:
+            self._log_warning(f"Could not refresh map canvas after generation: {exc}", notify_user=False)
+
     def _begin_processing_progress(self, total_steps: int) -> None:
         if self.dlg is not None and hasattr(self.dlg, "begin_processing"):
             self.dlg.begin_processing(total_steps)
@@ -1709,8 +1743,7 @@ class SafeguardingBuilder(
                 # Generate runway name (keep this logic)
                 primary_desig = f"{designator_num:02d}{suffix}"
                 reciprocal_num = (designator_num + 18) if designator_num <= 18 else (designator_num - 18)
-                reciprocal_suffix_map = {"L": "R", "R": "L", "C": "C", "": ""}
-                reciprocal_suffix = reciprocal_suffix_map.get(suffix, "")
+                reciprocal_suffix = RECIPROCAL_RUNWAY_SUFFIX.get(suffix, "")
                 reciprocal_desig = f"{reciprocal_num:02d}{reciprocal_suffix}"
                 short_runway_name = f"{primary_desig}/{reciprocal_desig}"
                 runway_data["short_name"] = short_runway_name
@@ -3332,17 +3365,7 @@ class SafeguardingBuilder(
             # Attempt to create geometry with Z value if elevation provided
             arp_geom: Optional[QgsGeometry] = None
             if arp_elevation is not None:
-                try:  # QgsPoint requires QGIS 3.x, use QgsPointXY as fallback if needed
-                    from qgis.core import QgsPoint  # type: ignore
-
-                    arp_geom = QgsGeometry(QgsPoint(arp_point.x(), arp_point.y(), arp_elevation))
-                except ImportError:
-                    arp_geom = QgsGeometry.fromPointXY(arp_point)  # Fallback to 2D
-                    QgsMessageLog.logMessage(
-                        "QgsPoint (3D) not available, creating 2D ARP geometry.",
-                        PLUGIN_TAG,
-                        level=Qgis.Warning,
-                    )
+                arp_geom = QgsGeometry(QgsPoint(arp_point.x(), arp_point.y(), arp_elevation))
             else:
                 arp_geom = QgsGeometry.fromPointXY(arp_point)
 
@@ -3609,6 +3632,36 @@ class SafeguardingBuilder(
             formatted[field_name] = ";".join(parts) if parts else None
         return formatted
 
+    @staticmethod
+    def _oriented_quad_corners(
+        origin: QgsPointXY,
+        forward: Tuple[float, float],
+        near_offset: float,
+        far_offset: float,
+        near_half_width: float,
+        far_half_width: float,
+    ) -> List[QgsPointXY]:
+        """Corners of a quad centred on a line through ``origin``.
+
+        ``forward`` is a unit ``(dx, dy)`` in the bearing convention used by
+        ``QgsPointXY.project``; the edge centres sit ``near_offset`` and
+        ``far_offset`` along it. Corners are returned near left, near right,
+        far right, far left, matching the single-projection helpers they
+        replace, from one trig pair instead of six ``project()`` calls.
+        """
+        fx, fy = forward
+        # Right-hand perpendicular of the forward bearing (azimuth + 90).
+        rx, ry = fy, -fx
+        ox, oy = origin.x(), origin.y()
+        near_x, near_y = ox + near_offset * fx, oy + near_offset * fy
+        far_x, far_y = ox + far_offset * fx, oy + far_offset * fy
+        return [
+            QgsPointXY(near_x - near_half_width * rx, near_y - near_half_width * ry),
+            QgsPointXY(near_x + near_half_width * rx, near_y + near_half_width * ry),
+            QgsPointXY(far_x + far_half_width * rx, far_y + far_half_width * ry),
+            QgsPointXY(far_x - far_half_width * rx, far_y - far_half_width * ry),
+        ]
+
     def _create_offset_rectangle(
         self,
         start_point: QgsPointXY,
@@ -3628,31 +3681,15 @@ class SafeguardingBuilder(
             )
             return None
         try:
-            # Calculate points (keep logic)
-            backward_azimuth = (outward_azimuth_degrees + 180.0) % 360.0
-            az_perp_r = (outward_azimuth_degrees + 90.0) % 360.0
-            az_perp_l = (outward_azimuth_degrees - 90.0 + 360.0) % 360.0
-            far_edge_center = start_point.project(far_edge_offset, outward_azimuth_degrees)
-            near_edge_center = far_edge_center.project(zone_length_backward, backward_azimuth)
-            if not far_edge_center or not near_edge_center:
-                QgsMessageLog.logMessage(
-                    f"Warning: Failed center point projection for '{description}'.",
-                    plugin_tag,
-                    level=Qgis.Warning,
-                )
-                return None
-            near_l = near_edge_center.project(half_width, az_perp_l)
-            near_r = near_edge_center.project(half_width, az_perp_r)
-            far_l = far_edge_center.project(half_width, az_perp_l)
-            far_r = far_edge_center.project(half_width, az_perp_r)
-            corner_points = [near_l, near_r, far_r, far_l]
-            if not all(p is not None for p in corner_points):
-                QgsMessageLog.logMessage(
-                    f"Warning: Failed corner point projection for '{description}'.",
-                    plugin_tag,
-                    level=Qgis.Warning,
-                )
-                return None
+            azimuth_rad = math.radians(outward_azimuth_degrees)
+            corner_points = self._oriented_quad_corners(
+                start_point,
+                (math.sin(azimuth_rad), math.cos(azimuth_rad)),
+                far_edge_offset - zone_length_backward,
+                far_edge_offset,
+                half_width,
+                half_width,
+            )
             # Call main polygon creator
             return self._create_polygon_from_corners(corner_points, description)
         except Exception as e:
@@ -3688,27 +3725,14 @@ class SafeguardingBuilder(
                     level=Qgis.Warning,
                 )
                 return None  # Already logged by helper
-            rect_start_center = point1.project(extension_m, params["azimuth_r_p"])
-            rect_end_center = point2.project(extension_m, params["azimuth_p_r"])
-            if not rect_start_center or not rect_end_center:
-                QgsMessageLog.logMessage(
-                    f"Warning: Failed center point projection for '{description}'.",
-                    plugin_tag,
-                    level=Qgis.Warning,
-                )
-                return None
-            corner_start_l = rect_start_center.project(half_width_m, params["azimuth_perp_l"])
-            corner_start_r = rect_start_center.project(half_width_m, params["azimuth_perp_r"])
-            corner_end_l = rect_end_center.project(half_width_m, params["azimuth_perp_l"])
-            corner_end_r = rect_end_center.project(half_width_m, params["azimuth_perp_r"])
-            corner_points = [corner_start_l, corner_start_r, corner_end_r, corner_end_l]
-            if not all(p is not None for p in corner_points):
-                QgsMessageLog.logMessage(
-                    f"Warning: Failed corner point projection for '{description}'.",
-                    plugin_tag,
-                    level=Qgis.Warning,
-                )
-                return None
+            corner_points = self._oriented_quad_corners(
+                point1,
+                params["direction_p_r"],
+                -extension_m,
+                params["length"] + extension_m,
+                half_width_m,
+                half_width_m,
+            )
             return self._create_polygon_from_corners(corner_points, description)
         except Exception as e:
             QgsMessageLog.logMessage(
@@ -3736,36 +3760,80 @@ class SafeguardingBuilder(
             )
             return None
         try:
-            az_perp_r = (outward_azimuth_degrees + 90.0) % 360.0
-            az_perp_l = (outward_azimuth_degrees - 90.0 + 360.0) % 360.0
-            inner_l = start_point.project(inner_half_width, az_perp_l)
-            inner_r = start_point.project(inner_half_width, az_perp_r)
-            outer_center = start_point.project(length, outward_azimuth_degrees)
-            if not outer_center:
+            azimuth_rad = math.radians(outward_azimuth_degrees)
+            corner_points = self._oriented_quad_corners(
+                start_point,
+                (math.sin(azimuth_rad), math.cos(azimuth_rad)),
+                0.0,
+                length,
+                inner_half_width,
+                outer_half_width,
+            )
+            return self._create_polygon_from_corners(corner_points, description)
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                f"Warning: Error during geometry calculation for '{description}': {e}",
+                plugin_tag,
+                level=Qgis.Warning,
+            )
+            return None
+
+    def _create_trapezoids(
+        self,
+        start_points: Sequence[QgsPointXY],
+        outward_directions: Sequence[Tuple[float, float]],
+        length: float,
+        inner_half_width: float,
+        outer_half_width: float,
+        descriptions: Sequence[str],
+    ) -> List[Optional[QgsGeometry]]:
+        """Creates several equally dimensioned trapezoids in one corner pass.
+
+        Corners follow ``_create_trapezoid`` (inner left, inner right, outer
+        right, outer left). ``outward_directions`` are unit ``(dx, dy)``
+        vectors in the ``QgsPointXY.project`` bearing convention, such as
+        ``direction_p_r`` from ``_get_runway_parameters``. Entries with an
+        invalid start point yield None.
+        """
+        plugin_tag = PLUGIN_TAG
+        count = len(start_points)
+        if count == 0:
+            return []
+        if length <= 0 or inner_half_width < 0 or outer_half_width < 0:
+            for description in descriptions:
                 QgsMessageLog.logMessage(
-                    f"Warning: Failed center point projection for '{description}'.",
+                    f"Skipping '{description}': Invalid start point/length/widths.",
                     plugin_tag,
                     level=Qgis.Warning,
                 )
-                return None
-            outer_l = outer_center.project(outer_half_width, az_perp_l)
-            outer_r = outer_center.project(outer_half_width, az_perp_r)
-            corner_points = [inner_l, inner_r, outer_r, outer_l]
-            if not all(p is not None for p in corner_points):
-                QgsMessageLog.logMessage(
-                    f"Warning: Failed corner point projection for '{description}'.",
-                    plugin_tag,
-                    level=Qgis.Warning,
+            return [None] * count
+        results: List[Optional[QgsGeometry]] = [None] * count
+        try:
+            for index, point in enumerate(start_points):
+                if not point:
+                    QgsMessageLog.logMessage(
+                        f"Skipping '{descriptions[index]}': Invalid start point/length/widths.",
+                        plugin_tag,
+                        level=Qgis.Warning,
+                    )
+                    continue
+                corner_points = self._oriented_quad_corners(
+                    point,
+                    outward_directions[index],
+                    0.0,
+                    length,
+                    inner_half_width,
+                    outer_half_width,
                 )
-                return None
-            return self._create_polygon_from_corners(corner_points, description)
+                results[index] = self._create_polygon_from_corners(corner_points, descriptions[index])
+            return results
         except Exception as e:
             QgsMessageLog.logMessage(
-                f"Warning: Error during geometry calculation for '{description}': {e}",
+                f"Warning: Error during batched trapezoid calculation for {', '.join(descriptions)}: {e}",
                 plugin_tag,
                 level=Qgis.Warning,
             )
-            return None
+            return results
 
     def _get_runway_parameters(self, thr_point: QgsPointXY, rec_thr_point: QgsPointXY) -> Optional[dict]:
         """Calculates basic length and azimuths between two threshold points."""
@@ -3785,6 +3853,16 @@ class SafeguardingBuilder(
             )
             return None
 
+        # Every generator re-derives the same runway geometry from the same
+        # threshold pair; reuse the first result for the rest of the run.
+        cache_key = (thr_point.x(), thr_point.y(), rec_thr_point.x(), rec_thr_point.y())
+        cache = getattr(self, "_runway_parameter_cache", None)
+        if cache is None:
+            cache = self._runway_parameter_cache = {}
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         try:
             length = thr_point.distance(rec_thr_point)
             azimuth_p_r = thr_point.azimuth(rec_thr_point)  # Primary THR -> Reciprocal THR
@@ -3817,13 +3895,22 @@ class SafeguardingBuilder(
             azimuth_p_r_norm = (azimuth_p_r + 360.0) % 360.0
             azimuth_r_p_norm = (azimuth_r_p + 360.0) % 360.0
 
-            return {
+            # Unit (dx, dy) vectors along the runway, in the bearing convention
+            # used by QgsPointXY.project(), so consumers can skip the trig.
+            azimuth_p_r_rad = math.radians(azimuth_p_r_norm)
+            direction_p_r = (math.sin(azimuth_p_r_rad), math.cos(azimuth_p_r_rad))
+
+            params = {
                 "length": length,
                 "azimuth_p_r": azimuth_p_r_norm,
                 "azimuth_r_p": azimuth_r_p_norm,
                 "azimuth_perp_l": azimuth_perp_l,
                 "azimuth_perp_r": azimuth_perp_r,
+                "direction_p_r": direction_p_r,
+                "direction_r_p": (-direction_p_r[0], -direction_p_r[1]),
             }
+            cache[cache_key] = params
+            return dict(params)
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Warning: Unexpected error calculating runway parameters: {e}",
@@ -3937,9 +4024,14 @@ class SafeguardingBuilder(
         return phys_end_point_primary, phys_end_point_reciprocal, total_physical_length
 
     def _create_polygon_from_corners(
-        self, corners: List[QgsPointXY], description: str = "Polygon"
+        self, corners: List[QgsPointXY], description: str = "Polygon", skip_validation: bool = False
     ) -> Optional[QgsGeometry]:
-        """Creates a QgsGeometry polygon from a list of corner points. Logs warnings on failure."""
+        """Creates a QgsGeometry polygon from a list of corner points. Logs warnings on failure.
+
+        ``skip_validation`` is for rectangles whose positive length and width
+        are checked by the caller; they are valid by construction, so the
+        GEOS validity check and makeValid() repair are skipped.
+        """
         plugin_tag = PLUGIN_TAG
 
         # Input validation
@@ -3976,6 +4068,8 @@ class SafeguardingBuilder(
                     level=Qgis.Warning,
                 )
                 return None
+            if skip_validation:
+                return geom
 
             # Check validity and attempt fix if necessary
             if not geom.isGeosValid():
@@ -4004,31 +4098,19 @@ class SafeguardingBuilder(
                 ]
 
                 if geom_valid.wkbType() in valid_multipoly_types:
-                    polygons = geom_valid.asMultiPolygon()
-                    largest_poly_geom = None
-                    max_area = -1.0
-                    if polygons:  # Check if conversion to MultiPolygon worked
-                        for poly_rings in polygons:
-                            # Ensure we handle potential empty ring lists
-                            if poly_rings and poly_rings[0]:  # Check if exterior ring exists
-                                try:
-                                    # Create temporary polygon from rings
-                                    temp_poly = QgsPolygon(
-                                        poly_rings[0], poly_rings[1:]
-                                    )  # Pass exterior and list of interiors
-                                    temp_geom = QgsGeometry(temp_poly)
-                                    if not temp_geom.isNull():
-                                        area = temp_geom.area()
-                                        if area > max_area:
-                                            max_area = area
-                                            largest_poly_geom = temp_geom
-                                except Exception as e_multi:
-                                    # Log error during specific polygon creation within multipolygon parts
-                                    QgsMessageLog.logMessage(
-                                        f"Warning: Error processing part of MultiPolygon for '{description}': {e_multi}",
-                                        plugin_tag,
-                                        level=Qgis.Warning,
-                                    )
+                    # asMultiPolygon() yields rings as QgsPointXY lists, which
+                    # fromPolygonXY() accepts directly (QgsPolygon does not).
+                    # Each candidate part is built once and ranked by area.
+                    part_geoms = (
+                        QgsGeometry.fromPolygonXY(poly_rings)
+                        for poly_rings in geom_valid.asMultiPolygon()
+                        if poly_rings and poly_rings[0]
+                    )
+                    largest_poly_geom = max(
+                        (part for part in part_geoms if not part.isNull()),
+                        key=QgsGeometry.area,
+                        default=None,
+                    )
 
                     if largest_poly_geom:
                         geom = largest_poly_geom  # Use the largest valid part
@@ -4052,14 +4134,15 @@ class SafeguardingBuilder(
                     # makeValid succeeded and resulted in a simple Polygon
                     geom = geom_valid
 
-            # Final check on the potentially modified geometry
-            if geom is None or geom.isNull() or geom.isEmpty() or not geom.isGeosValid():
-                QgsMessageLog.logMessage(
-                    f"Cannot create polygon '{description}': Final geometry check failed (Null/Empty/Invalid).",
-                    plugin_tag,
-                    level=Qgis.Warning,
-                )
-                return None
+                # Final check on the repaired geometry; the unrepaired path
+                # already passed isGeosValid() above.
+                if geom is None or geom.isNull() or geom.isEmpty() or not geom.isGeosValid():
+                    QgsMessageLog.logMessage(
+                        f"Cannot create polygon '{description}': Final geometry check failed (Null/Empty/Invalid).",
+                        plugin_tag,
+                        level=Qgis.Warning,
+                    )
+                    return None
 
             # If we reach here, geometry should be valid
             return geom
@@ -4090,28 +4173,15 @@ class SafeguardingBuilder(
             )
             return None
         try:
-            end_center_point = start_center_point.project(length, outward_azimuth)
-            if not end_center_point:
-                QgsMessageLog.logMessage(
-                    f"Warning: Failed end point projection for '{description}'",
-                    plugin_tag,
-                    level=Qgis.Warning,
-                )
-                return None
-            azimuth_perp_r = (outward_azimuth + 90.0) % 360.0
-            azimuth_perp_l = (outward_azimuth - 90.0 + 360.0) % 360.0
-            start_l = start_center_point.project(half_width, azimuth_perp_l)
-            start_r = start_center_point.project(half_width, azimuth_perp_r)
-            end_l = end_center_point.project(half_width, azimuth_perp_l)
-            end_r = end_center_point.project(half_width, azimuth_perp_r)
-            corners = [start_l, start_r, end_r, end_l]
-            if not all(p is not None for p in corners):
-                QgsMessageLog.logMessage(
-                    f"Warning: Failed corner point projection for '{description}'",
-                    plugin_tag,
-                    level=Qgis.Warning,
-                )
-                return None
+            azimuth_rad = math.radians(outward_azimuth)
+            corners = self._oriented_quad_corners(
+                start_center_point,
+                (math.sin(azimuth_rad), math.cos(azimuth_rad)),
+                0.0,
+                length,
+                half_width,
+                half_width,
+            )
             return self._create_polygon_from_corners(corners, description)
         except Exception as e:
             QgsMessageLog.logMessage(
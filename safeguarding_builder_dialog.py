@@ -57,6 +57,7 @@ try:
     from .dialog.cns_table import CnsTableMixin
     from .dialog.agl_options import AglOptionsMixin
     from .dialog.persistence import PersistenceMixin
+    from .core.constants import RECIPROCAL_RUNWAY_SUFFIX
     from .core.run_history import classify_runway_configuration
     from .frameworks.registry import DEFAULT_FRAMEWORK_ID, iter_framework_profiles
     from .rulesets.registry import (
@@ -85,6 +86,7 @@ except ImportError:
     from dialog.cns_table import CnsTableMixin  # type: ignore
     from dialog.agl_options import AglOptionsMixin  # type: ignore
     from dialog.persistence import PersistenceMixin  # type: ignore
+    from core.constants import RECIPROCAL_RUNWAY_SUFFIX  # type: ignore
     from core.run_history import classify_runway_configuration  # type: ignore
     from frameworks.registry import DEFAULT_FRAMEWORK_ID, iter_framework_profiles  # type: ignore
     from rulesets.registry import (  # type: ignore
@@ -2894,8 +2896,7 @@ class SafeguardingBuilderDialog(
                 # Calculate reciprocal designation (both formats)
                 reciprocal_val = (rwy_desig_val + 18) if rwy_desig_val <= 18 else (rwy_desig_val - 18)
                 rec_desig_num_str = f"{reciprocal_val:02d}"  # e.g., "27"
-                rec_suffix_map = {"L": "R", "R": "L", "C": "C", "": ""}
-                rec_suffix = rec_suffix_map.get(rwy_suffix, "")  # e.g., "R"
+                rec_suffix = RECIPROCAL_RUNWAY_SUFFIX.get(rwy_suffix, "")  # e.g., "R"
                 compact_desig_2 = f"{rec_desig_num_str}{rec_suffix}"  # e.g., "27R"
                 full_desig_2_str = f"RWY {compact_desig_2}"  # e.g., "RWY 27R" (needed for header + type label)
                 type2_label_str = f"{full_desig_2_str} Approach Type:"  # Update type label text
@@ -2928,7 +2929,7 @@ class SafeguardingBuilderDialog(
             rec_thr_east_str = input_data.get("rec_easting")
             rec_thr_north_str = input_data.get("rec_northing")
             distance_str, azimuth_str = ENTER_COORDS_MSG, ENTER_COORDS_MSG
-            if all([thr_east_str, thr_north_str, rec_thr_east_str, rec_thr_north_str]):
+            if thr_east_str and thr_north_str and rec_thr_east_str and rec_thr_north_str:
                 try:  # Inner try for coordinate math
                     p1 = QgsPointXY(float(thr_east_str), float(thr_north_str))
                     p2 = QgsPointXY(float(rec_thr_east_str), float(rec_thr_north_str))
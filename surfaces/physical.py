@@ -26,6 +26,54 @@ from ..core.run_log import QgsMessageLog
 
 PLUGIN_TAG = "SafeguardingBuilder"
 
+# Physical-geometry element type -> style key, and the order their layers are created.
+PHYSICAL_LAYER_STYLE_KEYS = {
+    "rwy": "Runway Pavement",
+    "PreThresholdRunway": "PreThreshold Runway",
+    "PreThresholdArea": "PreThreshold Area",
+    "Shoulder": "Runway Shoulders",
+    "DeclaredDistance": "Default Point",
+    "DetailedThresholdMarking": "Runway Marking White",
+    "DetailedDesignationMarking": "Runway Designation Text",
+    "DetailedCentrelineMarking": "Runway Marking White",
+    "DetailedAimingPointMarking": "Runway Marking White",
+    "DetailedTouchdownZoneMarking": "Runway Marking White",
+    "DetailedDisplacedThresholdMarking": "Runway Marking White",
+    "DetailedPreThresholdAreaMarking": "Runway Marking Yellow",
+    "DetailedRunwayHoldingPositionMarking": "Runway Marking Yellow",
+    "DetailedSideStripeMarking": "Runway Marking White",
+    "DetailedMarkingQA": "Default Point",
+    "Stopway": "Stopways",
+    "Clearway": "Clearways",
+    "GradedStrip": "Runway Graded Strips",
+    "FlyoverStrip": "Runway Strip Flyover Area",
+    "OverallStrip": "Runway Overall Strips",
+    "RESA": "Runway End Safety Areas (RESA)",
+}
+PHYSICAL_LAYER_ORDER = (
+    "rwy",
+    "PreThresholdRunway",
+    "PreThresholdArea",
+    "Shoulder",
+    "DeclaredDistance",
+    "DetailedThresholdMarking",
+    "DetailedDesignationMarking",
+    "DetailedCentrelineMarking",
+    "DetailedAimingPointMarking",
+    "DetailedTouchdownZoneMarking",
+    "DetailedDisplacedThresholdMarking",
+    "DetailedPreThresholdAreaMarking",
+    "DetailedRunwayHoldingPositionMarking",
+    "DetailedSideStripeMarking",
+    "DetailedMarkingQA",
+    "Stopway",
+    "Clearway",
+    "GradedStrip",
+    "FlyoverStrip",
+    "OverallStrip",
+    "RESA",
+)
+
 
 class PhysicalGeometryMixin:
     def _policy_ref(self, values: Optional[dict], generic_key: str, *fallback_keys: str) -> str:
@@ -376,54 +424,8 @@ class PhysicalGeometryMixin:
                         "group": protection_area_group,
                     },
                 }
-                style_key_map = {
-                    "rwy": "Runway Pavement",
-                    "PreThresholdRunway": "PreThreshold Runway",
-                    "PreThresholdArea": "PreThreshold Area",
-                    "Shoulder": "Runway Shoulders",
-                    "DeclaredDistance": "Default Point",
-                    "DetailedThresholdMarking": "Runway Marking White",
-                    "DetailedDesignationMarking": "Runway Designation Text",
-                    "DetailedCentrelineMarking": "Runway Marking White",
-                    "DetailedAimingPointMarking": "Runway Marking White",
-                    "DetailedTouchdownZoneMarking": "Runway Marking White",
-                    "DetailedDisplacedThresholdMarking": "Runway Marking White",
-                    "DetailedPreThresholdAreaMarking": "Runway Marking Yellow",
-                    "DetailedRunwayHoldingPositionMarking": "Runway Marking Yellow",
-                    "DetailedSideStripeMarking": "Runway Marking White",
-                    "DetailedMarkingQA": "Default Point",
-                    "Stopway": "Stopways",
-                    "Clearway": "Clearways",
-                    "GradedStrip": "Runway Graded Strips",
-                    "FlyoverStrip": "Runway Strip Flyover Area",
-                    "OverallStrip": "Runway Overall Strips",
-                    "RESA": "Runway End Safety Areas (RESA)",
-                }
-                layer_creation_order = [
-                    "rwy",
-                    "PreThresholdRunway",
-                    "PreThresholdArea",
-                    "Shoulder",
-                    "DeclaredDistance",
-                    "DetailedThresholdMarking",
-                    "DetailedDesignationMarking",
-                    "DetailedCentrelineMarking",
-                    "DetailedAimingPointMarking",
-                    "DetailedTouchdownZoneMarking",
-                    "DetailedDisplacedThresholdMarking",
-                    "DetailedPreThresholdAreaMarking",
-                    "DetailedRunwayHoldingPositionMarking",
-                    "DetailedSideStripeMarking",
-                    "DetailedMarkingQA",
-                    "Stopway",
-                    "Clearway",
-                    "GradedStrip",
-                    "FlyoverStrip",
-                    "OverallStrip",
-                    "RESA",
-                ]
 
-                for element_type in layer_creation_order:
+                for element_type in PHYSICAL_LAYER_ORDER:
                     definition = layer_definitions[element_type]
                     target_group = definition.get("group")
                     if target_group is None:
@@ -449,9 +451,10 @@ class PhysicalGeometryMixin:
                     physical_layer_specs[element_type] = {
                         "display_name": layer_display_name,
                         "fields": fields_copy,
+                        "field_index": {name: idx for idx, name in enumerate(fields_copy.names())},
                         "geom_type": geom_type_str,
                         "group": target_group,
-                        "style_key": style_key_map.get(element_type, "Default Polygon"),
+                        "style_key": PHYSICAL_LAYER_STYLE_KEYS.get(element_type, "Default Polygon"),
                     }
                     physical_features[element_type] = []
 
@@ -493,10 +496,9 @@ class PhysicalGeometryMixin:
                                     "calc_src": declared_record.get("calc_src", "calculated"),
                                     "notes": declared_record.get("notes", ""),
                                 }
-                                for field_name, value in declared_attrs.items():
-                                    idx = declared_feature.fieldNameIndex(field_name)
-                                    if idx != -1:
-                                        declared_feature.setAttribute(idx, value)
+                                self._set_feature_attributes(
+                                    declared_feature, declared_spec["field_index"], declared_attrs
+                                )
                                 physical_features["DeclaredDistance"].append(declared_feature)
                                 any_physical_or_protection_ok = True
 
@@ -521,11 +523,8 @@ class PhysicalGeometryMixin:
                             target_spec = physical_layer_specs.get(element_type)
                             if target_spec is None:
                                 continue
-                            if geometry is None or geometry.isEmpty():
-                                continue
-                            if not geometry.isGeosValid():
-                                geometry = geometry.makeValid()
-                            if geometry is None or geometry.isEmpty() or not geometry.isGeosValid():
+                            geometry = self._ensure_valid_geometry(geometry, f"{element_type} for {runway_name_log}")
+                            if geometry is None:
                                 continue
 
                             if element_type == "rwy":
@@ -547,10 +546,7 @@ class PhysicalGeometryMixin:
 
                             feature = QgsFeature(target_spec["fields"])
                             feature.setGeometry(geometry)
-                            for field_name, value in attributes.items():
-                                idx = feature.fieldNameIndex(field_name)
-                                if idx != -1:
-                                    feature.setAttribute(idx, value)
+                            self._set_feature_attributes(feature, target_spec["field_index"], attributes)
 
                             physical_features[element_type].append(feature)
                             any_physical_or_protection_ok = True
@@ -560,19 +556,13 @@ class PhysicalGeometryMixin:
                             target_spec = physical_layer_specs.get(element_type)
                             if target_spec is None:
                                 continue
-                            if geometry is None or geometry.isEmpty():
-                                continue
-                            if not geometry.isGeosValid():
-                                geometry = geometry.makeValid()
-                            if geometry is None or geometry.isEmpty() or not geometry.isGeosValid():
+                            geometry = self._ensure_valid_geometry(geometry, f"{element_type} for {runway_name_log}")
+                            if geometry is None:
                                 continue
 
                             feature = QgsFeature(target_spec["fields"])
                             feature.setGeometry(geometry)
-                            for field_name, value in attributes.items():
-                                idx = feature.fieldNameIndex(field_name)
-                                if idx != -1:
-                                    feature.setAttribute(idx, value)
+                            self._set_feature_attributes(feature, target_spec["field_index"], attributes)
 
                             physical_features[element_type].append(feature)
                             any_physical_or_protection_ok = True
@@ -622,7 +612,7 @@ class PhysicalGeometryMixin:
                 )
                 any_layer_successfully_processed_in_this_block = False
 
-                for element_type in layer_creation_order:
+                for element_type in PHYSICAL_LAYER_ORDER:
                     spec = physical_layer_specs.get(element_type)
                     if spec is None:
                         continue
@@ -695,6 +685,16 @@ class PhysicalGeometryMixin:
         letter_rank = "ABCDEF".find(arc_letter[:1]) + 1 if arc_letter else 0
         return arc_number, letter_rank, float(runway_length or 0.0)
 
+    def _set_feature_attributes(self, feature: QgsFeature, field_index: Dict[str, int], attributes: dict) -> None:
+        """Set attributes by name using a precomputed name -> index map for the layer's fields."""
+        for field_name, value in attributes.items():
+            idx = field_index.get(field_name)
+            if idx is None:
+                # Keep QgsFields' case-insensitive/alias lookup for names outside the map.
+                idx = feature.fieldNameIndex(field_name)
+            if idx != -1:
+                feature.setAttribute(idx, value)
+
     def _append_feature_note(self, feature: QgsFeature, note: str) -> None:
         notes_idx = feature.fieldNameIndex("notes")
         if notes_idx == -1:
@@ -814,13 +814,9 @@ class PhysicalGeometryMixin:
                     continue
                 if not polygonal_geom.isGeosValid():
                     polygonal_geom = polygonal_geom.makeValid()
-                if (
-                    polygonal_geom is None
-                    or polygonal_geom.isEmpty()
-                    or polygonal_geom.type() != QgsWkbTypes.PolygonGeometry
-                    or polygonal_geom.isMultipart()
-                    or not polygonal_geom.isGeosValid()
-                ):
+                    if polygonal_geom is None or polygonal_geom.isEmpty() or not polygonal_geom.isGeosValid():
+                        continue
+                if polygonal_geom.type() != QgsWkbTypes.PolygonGeometry or polygonal_geom.isMultipart():
                     continue
                 polygonal_geometries.append(polygonal_geom)
             return polygonal_geometries
@@ -1084,24 +1080,19 @@ class PhysicalGeometryMixin:
     ) -> Optional[QgsGeometry]:
         if length_m <= 0 or width_m <= 0:
             return None
-        start_center = origin.project(start_offset_m, runway_azimuth)
-        end_center = origin.project(start_offset_m + length_m, runway_azimuth)
-        if start_center is None or end_center is None:
-            return None
-
-        start_center = self._project_lateral(start_center, lateral_center_m, runway_azimuth)
-        end_center = self._project_lateral(end_center, lateral_center_m, runway_azimuth)
+        azimuth_rad = math.radians(runway_azimuth)
+        fx, fy = math.sin(azimuth_rad), math.cos(azimuth_rad)
+        # Positive lateral offsets are to the right of the runway azimuth.
+        lateral_origin = QgsPointXY(origin.x() + lateral_center_m * fy, origin.y() - lateral_center_m * fx)
         half_width = width_m / 2.0
-        az_l = (runway_azimuth - 90.0 + 360.0) % 360.0
-        az_r = (runway_azimuth + 90.0) % 360.0
-        corners = [
-            start_center.project(half_width, az_l),
-            start_center.project(half_width, az_r),
-            end_center.project(half_width, az_r),
-            end_center.project(half_width, az_l),
-        ]
-        if not all(corners):
-            return None
+        corners = self._oriented_quad_corners(
+            lateral_origin,
+            (fx, fy),
+            start_offset_m,
+            start_offset_m + length_m,
+            half_width,
+            half_width,
+        )
         return self._create_polygon_from_corners(corners, description)
 
     def _create_pre_threshold_chevron_polygon(
@@ -2317,6 +2308,23 @@ class PhysicalGeometryMixin:
         )
         return generated
 
+    @staticmethod
+    def _lateral_offsets(
+        point: QgsPointXY, offset: float, direction: Tuple[float, float]
+    ) -> Tuple[QgsPointXY, QgsPointXY]:
+        """Returns the points ``offset`` metres left and right of ``point``.
+
+        ``direction`` is the runway's unit ``(dx, dy)`` from
+        ``_get_runway_parameters``; the result matches projecting along
+        ``azimuth_perp_l`` and ``azimuth_perp_r`` without the per-call trig.
+        """
+        dx, dy = direction
+        x, y = point.x(), point.y()
+        return (
+            QgsPointXY(x - offset * dy, y + offset * dx),
+            QgsPointXY(x + offset * dy, y - offset * dx),
+        )
+
     def generate_physical_geometry(self, runway_data: dict) -> Optional[List[Tuple[str, QgsGeometry, dict]]]:
         """
         Calculates geometry and attributes for physical runway components.
@@ -2415,13 +2423,11 @@ class PhysicalGeometryMixin:
         if runway_width is not None and runway_width > 0:
             try:
                 half_width = runway_width / 2.0
-                thr_l = thr_point.project(half_width, rwy_params["azimuth_perp_l"])
-                thr_r = thr_point.project(half_width, rwy_params["azimuth_perp_r"])
-                rec_l = rec_thr_point.project(half_width, rwy_params["azimuth_perp_l"])
-                rec_r = rec_thr_point.project(half_width, rwy_params["azimuth_perp_r"])
-                if all([thr_l, thr_r, rec_l, rec_r]):
+                thr_l, thr_r = self._lateral_offsets(thr_point, half_width, rwy_params["direction_p_r"])
+                rec_l, rec_r = self._lateral_offsets(rec_thr_point, half_width, rwy_params["direction_p_r"])
+                if thr_l and thr_r and rec_l and rec_r:
                     landing_pavement_geom = self._create_polygon_from_corners(
-                        [thr_l, thr_r, rec_r, rec_l], f"Landing Pavement {log_name}"
+                        [thr_l, thr_r, rec_r, rec_l], f"Landing Pavement {log_name}", skip_validation=True
                     )
                     if landing_pavement_geom:
                         landing_length = rwy_params["length"]
@@ -2468,14 +2474,13 @@ class PhysicalGeometryMixin:
                 try:
                     start_point = phys_p_start
                     end_point = thr_point
-                    p_start_l = start_point.project(half_width, rwy_params["azimuth_perp_l"])
-                    p_start_r = start_point.project(half_width, rwy_params["azimuth_perp_r"])
-                    p_end_l = end_point.project(half_width, rwy_params["azimuth_perp_l"])
-                    p_end_r = end_point.project(half_width, rwy_params["azimuth_perp_r"])
-                    if all([p_start_l, p_start_r, p_end_l, p_end_r]):
+                    p_start_l, p_start_r = self._lateral_offsets(start_point, half_width, rwy_params["direction_p_r"])
+                    p_end_l, p_end_r = self._lateral_offsets(end_point, half_width, rwy_params["direction_p_r"])
+                    if p_start_l and p_start_r and p_end_l and p_end_r:
                         geom = self._create_polygon_from_corners(
                             [p_start_l, p_start_r, p_end_r, p_end_l],
                             f"Pre-Threshold {primary_desig}",
+                            skip_validation=True,
                         )
                         if geom:
                             physical_refs = self.get_active_ruleset().physical_refs()
@@ -2507,14 +2512,13 @@ class PhysicalGeometryMixin:
                 try:
                     start_point = phys_p_end
                     end_point = rec_thr_point
-                    r_start_l = start_point.project(half_width, rwy_params["azimuth_perp_l"])
-                    r_start_r = start_point.project(half_width, rwy_params["azimuth_perp_r"])
-                    r_end_l = end_point.project(half_width, rwy_params["azimuth_perp_l"])
-                    r_end_r = end_point.project(half_width, rwy_params["azimuth_perp_r"])
-                    if all([r_start_l, r_start_r, r_end_l, r_end_r]):
+                    r_start_l, r_start_r = self._lateral_offsets(start_point, half_width, rwy_params["direction_p_r"])
+                    r_end_l, r_end_r = self._lateral_offsets(end_point, half_width, rwy_params["direction_p_r"])
+                    if r_start_l and r_start_r and r_end_l and r_end_r:
                         geom = self._create_polygon_from_corners(
                             [r_start_l, r_start_r, r_end_r, r_end_l],
                             f"Pre-Threshold {reciprocal_desig}",
+                            skip_validation=True,
                         )
                         if geom:
                             physical_refs = self.get_active_ruleset().physical_refs()
@@ -2615,17 +2619,15 @@ class PhysicalGeometryMixin:
         if shoulder_width is not None and shoulder_width > 0 and runway_width is not None and runway_width > 0:
             try:
                 half_width = runway_width / 2.0
-                phys_start_l = phys_p_start.project(half_width, rwy_params["azimuth_perp_l"])
-                phys_start_r = phys_p_start.project(half_width, rwy_params["azimuth_perp_r"])
-                phys_end_l = phys_p_end.project(half_width, rwy_params["azimuth_perp_l"])
-                phys_end_r = phys_p_end.project(half_width, rwy_params["azimuth_perp_r"])
-                if not all([phys_start_l, phys_start_r, phys_end_l, phys_end_r]):
+                direction = rwy_params["direction_p_r"]
+                phys_start_l, phys_start_r = self._lateral_offsets(phys_p_start, half_width, direction)
+                phys_end_l, phys_end_r = self._lateral_offsets(phys_p_end, half_width, direction)
+                if not (phys_start_l and phys_start_r and phys_end_l and phys_end_r):
                     raise ValueError("Failed to calculate physical pavement corners for shoulders.")
 
-                outer_start_l = phys_start_l.project(shoulder_width, rwy_params["azimuth_perp_l"])
-                outer_start_r = phys_start_r.project(shoulder_width, rwy_params["azimuth_perp_r"])
-                outer_end_l = phys_end_l.project(shoulder_width, rwy_params["azimuth_perp_l"])
-                outer_end_r = phys_end_r.project(shoulder_width, rwy_params["azimuth_perp_r"])
+                outer_half_width = half_width + shoulder_width
+                outer_start_l, outer_start_r = self._lateral_offsets(phys_p_start, outer_half_width, direction)
+                outer_end_l, outer_end_r = self._lateral_offsets(phys_p_end, outer_half_width, direction)
 
                 physical_refs = self.get_active_ruleset().physical_refs()
                 shoulder_ref = physical_refs.get("shoulder", "MOS 6.2.4")
@@ -2638,14 +2640,16 @@ class PhysicalGeometryMixin:
                     "ref_mos": shoulder_ref,
                 }
 
-                if all([outer_start_l, outer_end_l]):
+                if outer_start_l and outer_end_l:
                     left_corners = [
                         phys_start_l,
                         outer_start_l,
                         outer_end_l,
                         phys_end_l,
                     ]
-                    left_shoulder_poly = self._create_polygon_from_corners(left_corners, f"Left Shoulder {log_name}")
+                    left_shoulder_poly = self._create_polygon_from_corners(
+                        left_corners, f"Left Shoulder {log_name}", skip_validation=True
+                    )
                     if left_shoulder_poly:
                         generated_elements.append(("Shoulder", left_shoulder_poly, shoulder_attrs.copy()))
                 else:
@@ -2655,14 +2659,16 @@ class PhysicalGeometryMixin:
                         level=Qgis.Warning,
                     )
 
-                if all([outer_start_r, outer_end_r]):
+                if outer_start_r and outer_end_r:
                     right_corners = [
                         phys_start_r,
                         phys_end_r,
                         outer_end_r,
                         outer_start_r,
                     ]
-                    right_shoulder_poly = self._create_polygon_from_corners(right_corners, f"Right Shoulder {log_name}")
+                    right_shoulder_poly = self._create_polygon_from_corners(
+                        right_corners, f"Right Shoulder {log_name}", skip_validation=True
+                    )
                     if right_shoulder_poly:
                         generated_elements.append(("Shoulder", right_shoulder_poly, shoulder_attrs.copy()))
                 else:
@@ -2709,8 +2715,11 @@ class PhysicalGeometryMixin:
                     level=Qgis.Warning,
                 )
 
-            if strip_dims and all(
-                strip_dims.get(dim) is not None for dim in ["overall_width", "graded_width", "extension_length"]
+            if (
+                strip_dims
+                and strip_dims.get("overall_width") is not None
+                and strip_dims.get("graded_width") is not None
+                and strip_dims.get("extension_length") is not None
             ):
                 extension = strip_dims["extension_length"]
                 graded_width = strip_dims["graded_width"]
@@ -2824,11 +2833,20 @@ class PhysicalGeometryMixin:
                             "ref_mos": flyover_ref,
                         }
 
-                        left_inner_p = strip_end_center_p.project(graded_half_width, rwy_params["azimuth_perp_l"])
-                        left_outer_p = strip_end_center_p.project(overall_half_width, rwy_params["azimuth_perp_l"])
-                        left_outer_r = strip_end_center_r.project(overall_half_width, rwy_params["azimuth_perp_l"])
-                        left_inner_r = strip_end_center_r.project(graded_half_width, rwy_params["azimuth_perp_l"])
-                        if all([left_inner_p, left_outer_p, left_outer_r, left_inner_r]):
+                        direction = rwy_params["direction_p_r"]
+                        left_inner_p, right_inner_p = self._lateral_offsets(
+                            strip_end_center_p, graded_half_width, direction
+                        )
+                        left_outer_p, right_outer_p = self._lateral_offsets(
+                            strip_end_center_p, overall_half_width, direction
+                        )
+                        left_inner_r, right_inner_r = self._lateral_offsets(
+                            strip_end_center_r, graded_half_width, direction
+                        )
+                        left_outer_r, right_outer_r = self._lateral_offsets(
+                            strip_end_center_r, overall_half_width, direction
+                        )
+                        if left_inner_p and left_outer_p and left_outer_r and left_inner_r:
                             left_flyover_geom = self._create_polygon_from_corners(
                                 [
                                     left_inner_p,
@@ -2847,18 +2865,7 @@ class PhysicalGeometryMixin:
                                     )
                                 )
 
-                        right_inner_p = strip_end_center_p.project(graded_half_width, rwy_params["azimuth_perp_r"])
-                        right_inner_r = strip_end_center_r.project(graded_half_width, rwy_params["azimuth_perp_r"])
-                        right_outer_r = strip_end_center_r.project(overall_half_width, rwy_params["azimuth_perp_r"])
-                        right_outer_p = strip_end_center_p.project(overall_half_width, rwy_params["azimuth_perp_r"])
-                        if all(
-                            [
-                                right_inner_p,
-                                right_inner_r,
-                                right_outer_r,
-                                right_outer_p,
-                            ]
-                        ):
+                        if right_inner_p and right_inner_r and right_outer_r and right_outer_p:
                             right_flyover_geom = self._create_polygon_from_corners(
                                 [
                                     right_inner_p,
@@ -151,6 +151,20 @@ class OlsSourceValidationTests(unittest.TestCase):
         self.assertEqual(CAP168_PROFILE.ols_parameters(1, "PA_I", "Approach")[0]["length"], 3000.0)
         self.assertEqual(CAP168_PROFILE.ihs_base_height(), 45.0)
 
+    def test_detached_params_copies_nested_ruleset_containers(self):
+        from rulesets.mos139 import ols_surfaces
+        from rulesets.ols_utils import detached_params
+
+        source = ols_surfaces.APPROACH_PARAMS[(3, "NPA")]
+        copied = detached_params(source)
+        self.assertEqual(copied, source)
+        self.assertIsNot(copied, source)
+        self.assertIsNot(copied[0], source[0])
+        copied[0]["length"] = -1.0
+        copied.append({})
+        self.assertEqual(source[0]["length"], 3000.0)
+        self.assertEqual(len(source), 3)
+
     def test_independent_mos139_elevations_and_contour_locations(self):
         case = self.manifest["analytical_cases"]["mos139_npa_code3"]
         approach = case["approach"]
@@ -0,0 +1,114 @@
+"""QGIS checks for the shared polygon construction helpers."""
+
+from __future__ import annotations
+
+import math
+import sys
+import unittest
+from pathlib import Path
+
+from qgis.core import QgsPointXY, QgsWkbTypes
+
+WORKSPACE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKSPACE.parent))
+
+from safeguarding_builder.safeguarding_builder import SafeguardingBuilder  # noqa: E402
+
+
+class PolygonRepairQgisTests(unittest.TestCase):
+    @staticmethod
+    def _builder():
+        builder = object.__new__(SafeguardingBuilder)
+        builder.translator = None
+        builder._run_log = None
+        return builder
+
+    def test_bow_tie_corners_are_repaired_to_the_largest_part(self):
+        # The first and third edges cross at (20/7, 20/7), splitting the ring
+        # into triangles of 40/7 and 250/7 square units.
+        corners = [
+            QgsPointXY(0.0, 0.0),
+            QgsPointXY(10.0, 10.0),
+            QgsPointXY(10.0, 0.0),
+            QgsPointXY(0.0, 4.0),
+        ]
+
+        geometry = self._builder()._create_polygon_from_corners(corners, "Bow tie")
+
+        self.assertIsNotNone(geometry)
+        self.assertEqual(
+            QgsWkbTypes.flatType(geometry.wkbType()),
+            QgsWkbTypes.Polygon,
+        )
+        self.assertTrue(geometry.isGeosValid())
+        self.assertAlmostEqual(geometry.area(), 250.0 / 7.0, places=6)
+
+    def test_valid_corners_are_returned_unchanged(self):
+        corners = [
+            QgsPointXY(0.0, 0.0),
+            QgsPointXY(4.0, 0.0),
+            QgsPointXY(4.0, 3.0),
+            QgsPointXY(0.0, 3.0),
+        ]
+
+        geometry = self._builder()._create_polygon_from_corners(corners, "Rectangle")
+
+        self.assertIsNotNone(geometry)
+        self.assertAlmostEqual(geometry.area(), 12.0, places=9)
+
+
+class CornerConventionQgisTests(unittest.TestCase):
+    AZIMUTHS = (0.0, 90.0, 180.0, 359.9)
+
+    def assertPointsEqual(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for actual_point, expected_point in zip(actual, expected):
+            self.assertAlmostEqual(actual_point.x(), expected_point.x(), delta=1e-9)
+            self.assertAlmostEqual(actual_point.y(), expected_point.y(), delta=1e-9)
+
+    def test_oriented_quad_corners_match_projection_chains(self):
+        origin = QgsPointXY(1000.0, 2000.0)
+        for azimuth in self.AZIMUTHS:
+            with self.subTest(azimuth=azimuth):
+                azimuth_rad = math.radians(azimuth)
+                corners = SafeguardingBuilder._oriented_quad_corners(
+                    origin,
+                    (math.sin(azimuth_rad), math.cos(azimuth_rad)),
+                    -60.0,
+                    900.0,
+                    75.0,
+                    150.0,
+                )
+                near_center = origin.project(-60.0, azimuth)
+                far_center = origin.project(900.0, azimuth)
+                self.assertPointsEqual(
+                    corners,
+                    [
+                        near_center.project(75.0, azimuth - 90.0),
+                        near_center.project(75.0, azimuth + 90.0),
+                        far_center.project(150.0, azimuth + 90.0),
+                        far_center.project(150.0, azimuth - 90.0),
+                    ],
+                )
+
+    def test_lateral_offsets_match_perpendicular_projections(self):
+        point = QgsPointXY(1000.0, 2000.0)
+        for azimuth in self.AZIMUTHS:
+            with self.subTest(azimuth=azimuth):
+                azimuth_rad = math.radians(azimuth)
+                left, right = SafeguardingBuilder._lateral_offsets(
+                    point,
+                    22.5,
+                    (math.sin(azimuth_rad), math.cos(azimuth_rad)),
+                )
+                self.assertPointsEqual(
+                    [left, right],
+                    [
+                        point.project(22.5, azimuth - 90.0),
+                        point.project(22.5, azimuth + 90.0),
+                    ],
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
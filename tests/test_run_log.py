@@ -78,6 +78,40 @@ class RunLogTests(unittest.TestCase):
         self.assertIn("count=2", skip_messages[0])
         self.assertIn("skips=2", self.records[-1][0])
 
+    def test_distinct_warnings_are_sampled_per_scope_with_a_summary(self):
+        run_log = RunLog(self.sink, diagnostics_enabled=False, warning_sample_limit=2)
+        run_log.start()
+        run_log.phase(1, 1, "outputs", "Writing outputs")
+        for runway in ("01/19", "07/25", "12/30", "16/34"):
+            run_log.warning("PSA", f"trapezoid failed for {runway}")
+        run_log.finish("completed", layers=1)
+
+        warn_messages = [
+            message for message, _tag, _level in self.records if message.startswith("WARN")
+        ]
+        self.assertEqual(len(warn_messages), 3)
+        self.assertIn("suppressed=2", warn_messages[-1])
+        self.assertIn("warnings=4", self.records[-1][0])
+
+    def test_warning_sampling_keeps_other_warning_kinds_visible(self):
+        run_log = RunLog(self.sink, diagnostics_enabled=False, warning_sample_limit=2)
+        run_log.start()
+        run_log.phase(1, 1, "outputs", "Writing outputs")
+        for index in range(5):
+            run_log.legacy(
+                f"Warning: Failed PSA trapezoid for 'RWY {index:02d}' at 1.{index} m",
+                Qgis.Warning,
+            )
+        run_log.legacy("Error difference DONUT 'x': empty result", Qgis.Warning)
+        run_log.flush()
+
+        warn_messages = [
+            message for message, _tag, _level in self.records if message.startswith("WARN")
+        ]
+        self.assertEqual(len(warn_messages), 4)
+        self.assertTrue(any("DONUT" in message for message in warn_messages))
+        self.assertIn("suppressed=3", warn_messages[-1])
+
     def test_diagnostics_are_opt_in_and_use_a_separate_tag(self):
         quiet = RunLog(self.sink, diagnostics_enabled=False)
         quiet.diagnostic("geometry", "candidate details")